@@ -0,0 +1,10 @@
+from .suite import SUITES, GRIDS, run_benchmarks, save_results, load_results, compare_results
+
+__all__ = [
+	"SUITES",
+	"GRIDS",
+	"run_benchmarks",
+	"save_results",
+	"load_results",
+	"compare_results"
+]
@@ -0,0 +1,48 @@
+import argparse
+import sys
+
+from .suite import GRIDS, SUITES, compare_results, load_results, run_benchmarks, save_results
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="python -m nbeats.benchmarks")
+	subparsers = parser.add_subparsers(dest="command", required=True)
+
+	run_parser = subparsers.add_parser("run", help="Run the benchmark suites and write a JSON results file.")
+	run_parser.add_argument("-o", "--output", required=True)
+	run_parser.add_argument(
+		"--suites", nargs="+", choices=sorted(SUITES), default=None,
+		help="Suites to run (default: all but 'distributed', which spawns worker processes)."
+	)
+	run_parser.add_argument("--grid", choices=sorted(GRIDS), default="quick")
+	run_parser.add_argument("--repeats", type=int, default=20)
+	run_parser.add_argument("--threads", type=int, default=None)
+
+	compare_parser = subparsers.add_parser("compare", help="Compare two results files and flag regressions.")
+	compare_parser.add_argument("baseline")
+	compare_parser.add_argument("candidate")
+	compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+	args = parser.parse_args(argv)
+
+	if args.command == "run":
+		results = run_benchmarks(
+			suites=args.suites, grid=args.grid, n_repeats=args.repeats, num_threads=args.threads
+		)
+		print(f"Saved {len(results['results'])} results to: {save_results(results, args.output)}")
+		return 0
+
+	comparisons = compare_results(load_results(args.baseline), load_results(args.candidate), args.threshold)
+	n_regressions = 0
+	for comparison in comparisons:
+		flag = "REGRESSION" if comparison["regression"] else ("improved" if comparison["improvement"] else "")
+		n_regressions += comparison["regression"]
+		print(
+			f"{comparison['name']:<26} {comparison['metric']:<20} "
+			f"{comparison['baseline_ms']:>10.3f} -> {comparison['candidate_ms']:>10.3f} ms "
+			f"({comparison['ratio']:.2f}x) {flag}  {comparison['params']}"
+		)
+	print(f"{n_regressions} regression(s) out of {len(comparisons)} comparison(s).")
+	return 1 if n_regressions else 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,280 @@
+import datetime
+import itertools
+import json
+import os
+import platform
+import statistics
+import time
+import warnings
+
+import numpy as np
+import torch
+
+from ..blocks import GenericBlock, TrendBlock
+from ..models import NBeatsGeneric, NBeatsInterpretable
+from ..stacks import GenericStack, TrendStack
+from ..utils import MultiSeriesWindowDataset, SlidingWindowDataset
+
+GRIDS = {
+	"quick": dict(
+		lengths=[(20, 5)],
+		hidden_dim=[64],
+		n_blocks=[3],
+		shared_weights=[True],
+		batch_size=[256],
+	),
+	"full": dict(
+		lengths=[(14, 7), (48, 24), (168, 48)],
+		hidden_dim=[64, 256, 512],
+		n_blocks=[1, 3, 6],
+		shared_weights=[True, False],
+		batch_size=[1, 64, 1024],
+	),
+}
+
+def time_fn(fn, n_warmup=3, n_repeats=20):
+	for _ in range(n_warmup):
+		fn()
+	times = list()
+	for _ in range(n_repeats):
+		start = time.perf_counter()
+		fn()
+		times.append(time.perf_counter() - start)
+	return {
+		"median_ms": 1000 * statistics.median(times),
+		"min_ms": 1000 * min(times),
+		"n_repeats": n_repeats,
+	}
+
+def _record(name, metric, params, timing, batch_size=None):
+	record = dict(name=name, metric=metric, params=params, **timing)
+	if batch_size:
+		record["samples_per_sec"] = 1000 * batch_size / max(timing["median_ms"], 1e-12)
+	return record
+
+def _module_records(name, module, params, X, n_repeats, intermediates=False):
+	batch_size = len(X)
+
+	def forward():
+		with torch.no_grad():
+			module(X)
+
+	X_grad = X.clone()
+	def backward():
+		module.zero_grad(set_to_none=True)
+		out = module(X_grad)
+		out = out[-1] if isinstance(out, tuple) else out
+		out.sum().backward()
+
+	yield _record(name, "forward", params, time_fn(forward, n_repeats=n_repeats), batch_size)
+	yield _record(name, "backward", params, time_fn(backward, n_repeats=n_repeats), batch_size)
+
+	if intermediates:
+		def forward_intermediates():
+			with torch.no_grad():
+				module(X, return_intermediates=True)
+		yield _record(
+			name, "return_intermediates", params,
+			time_fn(forward_intermediates, n_repeats=n_repeats), batch_size
+		)
+
+def _grid(grid):
+	keys = list(grid)
+	for values in itertools.product(*(grid[key] for key in keys)):
+		params = dict(zip(keys, values))
+		params["backcast"], params["forecast"] = params.pop("lengths")
+		yield params
+
+def bench_blocks(grid, n_repeats):
+	seen = set()
+	for params in _grid(grid):
+		key = (params["backcast"], params["forecast"], params["hidden_dim"], params["batch_size"])
+		if key in seen:
+			continue
+		seen.add(key)
+		block_params = dict(
+			backcast=params["backcast"], forecast=params["forecast"],
+			hidden_dim=params["hidden_dim"], batch_size=params["batch_size"]
+		)
+		X = torch.randn(params["batch_size"], params["backcast"])
+		block = GenericBlock(params["backcast"], params["forecast"], n_theta=4, hidden_dim=params["hidden_dim"])
+		yield from _module_records("GenericBlock", block, block_params, X, n_repeats)
+
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore")
+			block = TrendBlock(params["backcast"], params["forecast"], degree=3, hidden_dim=params["hidden_dim"])
+		yield from _module_records("TrendBlock", block, block_params, X, n_repeats)
+
+def bench_stacks(grid, n_repeats):
+	for params in _grid(grid):
+		X = torch.randn(params["batch_size"], params["backcast"])
+		common = dict(
+			n_blocks=params["n_blocks"], backcast=params["backcast"], forecast=params["forecast"],
+			n_layers=4, hidden_dim=params["hidden_dim"], shared_weights=params["shared_weights"]
+		)
+		stack = GenericStack(n_theta=4, **common)
+		yield from _module_records("GenericStack", stack, params, X, n_repeats, intermediates=True)
+
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore")
+			stack = TrendStack(degree=3, **common)
+		yield from _module_records("TrendStack", stack, params, X, n_repeats, intermediates=True)
+
+def bench_models(grid, n_repeats):
+	for params in _grid(grid):
+		X = torch.randn(params["batch_size"], params["backcast"])
+		common = dict(
+			n_blocks=params["n_blocks"], backcast=params["backcast"], forecast=params["forecast"],
+			hidden_dim=params["hidden_dim"], shared_weights=params["shared_weights"]
+		)
+		model = NBeatsGeneric(n_stacks=2, **common)
+		yield from _module_records("NBeatsGeneric", model, params, X, n_repeats, intermediates=True)
+
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore")
+			model = NBeatsInterpretable(**common)
+		yield from _module_records("NBeatsInterpretable", model, params, X, n_repeats, intermediates=True)
+
+def bench_datasets(grid, n_repeats, n_points=1_000_000, n_series=1000):
+	random = np.random.default_rng(seed=0)
+	values = random.standard_normal(n_points).astype(np.float32)
+	seen = set()
+	for params in _grid(grid):
+		key = (params["backcast"], params["forecast"], params["batch_size"])
+		if key in seen:
+			continue
+		seen.add(key)
+		data_params = dict(
+			backcast=params["backcast"], forecast=params["forecast"],
+			batch_size=params["batch_size"], n_points=n_points
+		)
+
+		datasets = {
+			"SlidingWindowDataset": SlidingWindowDataset(
+				values, backcast=params["backcast"], forecast=params["forecast"]
+			),
+			"MultiSeriesWindowDataset": MultiSeriesWindowDataset(
+				np.array_split(values, n_series), backcast=params["backcast"], forecast=params["forecast"]
+			),
+		}
+		for name, dataset in datasets.items():
+			indices = random.integers(0, len(dataset), size=(n_repeats + 3, params["batch_size"]))
+			batches = iter(itertools.cycle(indices))
+			timing = time_fn(lambda: dataset[next(batches)], n_repeats=n_repeats)
+			yield _record(name, "batch_fetch", data_params, timing, params["batch_size"])
+
+DISTRIBUTED_WORLD_SIZES = (1, 2, 4)
+
+def _distributed_worker(rank, world_size, params, n_repeats):
+	from ..training.distributed import DistributedTrainer
+
+	torch.manual_seed(0)
+	model = NBeatsGeneric(
+		n_stacks=2, n_blocks=params["n_blocks"], backcast=params["backcast"], forecast=params["forecast"],
+		hidden_dim=params["hidden_dim"], shared_weights=params["shared_weights"]
+	)
+	trainer = DistributedTrainer(model, batch_size=params["batch_size"])
+	X = torch.randn(params["batch_size"], params["backcast"])
+	y = torch.randn(params["batch_size"], params["forecast"])
+
+	def step():
+		trainer._compute_loss(X, y).backward()
+		trainer._optimizer_step()
+
+	# Every rank runs the same steps (they synchronize in all_reduce); rank 0 reports.
+	return time_fn(step, n_repeats=n_repeats)
+
+def bench_distributed(grid, n_repeats):
+	# Weak scaling of DistributedTrainer: batch_size windows per rank, cpu_count / world_size
+	# threads per rank. samples_per_sec counts the global batch; scaling is relative to 1 rank.
+	from ..training.distributed import launch
+
+	world_sizes = [size for size in DISTRIBUTED_WORLD_SIZES if size <= (os.cpu_count() or 1)]
+	seen = set()
+	for params in _grid(grid):
+		key = tuple(sorted(params.items()))
+		if key in seen or params["batch_size"] < 2:
+			continue
+		seen.add(key)
+		baseline = None
+		for world_size in world_sizes:
+			timing = launch(_distributed_worker, world_size, args=(params, n_repeats))
+			record = _record(
+				"DataParallelTraining", "train_step", dict(params, world_size=world_size),
+				timing, params["batch_size"] * world_size
+			)
+			baseline = baseline or record["samples_per_sec"]
+			record["scaling"] = record["samples_per_sec"] / baseline
+			yield record
+
+SUITES = {
+	"blocks": bench_blocks,
+	"stacks": bench_stacks,
+	"models": bench_models,
+	"datasets": bench_datasets,
+	"distributed": bench_distributed,
+}
+# Run when suites=None. "distributed" spawns gloo process groups, so it is opt-in (--suites).
+DEFAULT_SUITES = ("blocks", "stacks", "models", "datasets")
+
+def metadata():
+	return {
+		"timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+		"torch": torch.__version__,
+		"numpy": np.__version__,
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"num_threads": torch.get_num_threads(),
+		"cpu_count": os.cpu_count(),
+	}
+
+def run_benchmarks(suites=None, grid="quick", n_repeats=20, num_threads=None, verbose=True):
+	if num_threads is not None:
+		torch.set_num_threads(num_threads)
+	grid = GRIDS[grid] if isinstance(grid, str) else grid
+	suites = suites or list(DEFAULT_SUITES)
+
+	results = list()
+	for suite in suites:
+		if suite not in SUITES:
+			raise ValueError(f"Unknown benchmark suite {suite!r}; expected one of {sorted(SUITES)}.")
+		for record in SUITES[suite](grid, n_repeats):
+			record["suite"] = suite
+			results.append(record)
+			if verbose:
+				print(f"{record['name']:<26} {record['metric']:<20} {record['median_ms']:>10.3f} ms  {record['params']}")
+	return {"metadata": metadata(), "results": results}
+
+def save_results(results, path):
+	os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+	with open(path, "w") as fp:
+		json.dump(results, fp, indent=2)
+	return path
+
+def load_results(path):
+	with open(path, "r") as fp:
+		return json.load(fp)
+
+def _result_key(record):
+	return (record["name"], record["metric"], json.dumps(record["params"], sort_keys=True))
+
+def compare_results(baseline, candidate, threshold=0.10):
+	# A regression is a median time more than `threshold` (relative) above the baseline.
+	baseline = {_result_key(record): record for record in baseline["results"]}
+	comparisons = list()
+	for record in candidate["results"]:
+		reference = baseline.get(_result_key(record))
+		if reference is None:
+			continue
+		ratio = record["median_ms"] / max(reference["median_ms"], 1e-12)
+		comparisons.append({
+			"name": record["name"],
+			"metric": record["metric"],
+			"params": record["params"],
+			"baseline_ms": reference["median_ms"],
+			"candidate_ms": record["median_ms"],
+			"ratio": ratio,
+			"regression": ratio > 1 + threshold,
+			"improvement": ratio < 1 - threshold,
+		})
+	return comparisons
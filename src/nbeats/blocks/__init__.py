@@ -1,12 +1,16 @@
 from .base import NBeatsBlock
+from .fixed_basis import FixedBasisBlock
 from .generic import GenericBlock
 from .trend import TrendBlock
 from .seasonality import SeasonalityBlock
+from .fused import FusedBlock
 
 __all__ = [
 	"NBeatsBlock",
+	"FixedBasisBlock",
 	"GenericBlock",
 	"TrendBlock",
-	"SeasonalityBlock"
+	"SeasonalityBlock",
+	"FusedBlock"
 ]
 
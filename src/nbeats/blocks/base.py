@@ -3,7 +3,13 @@ from abc import ABC, abstractmethod
 import torch
 import torch.nn
 
+from .cost import fc_stack_cost
+from .fused import FusedBlock
+
 class NBeatsBlock(torch.nn.Module, ABC):
+	# Submodules swapped for dynamically quantized versions; the bases stay in float.
+	QUANTIZABLE_MODULES = ("fc_stack", "theta")
+
 	def __init__(self, backcast, forecast, n_layers, n_theta, hidden_dim):
 		super().__init__()
 		self.backcast = backcast
@@ -39,6 +45,24 @@ class NBeatsBlock(torch.nn.Module, ABC):
 	def get_basis_vectors(self):
 		pass
 
+	@abstractmethod
+	def _get_basis_weights(self):
+		pass
+
+	def fuse(self):
+		return FusedBlock.from_block(self)
+
+	def estimate_cost(self, batch_size, element_size=4):
+		fc_flops, fc_activations = fc_stack_cost(self.fc_stack, batch_size)
+		length = self.backcast + self.forecast
+		activations = fc_activations + batch_size * (2 * self.n_theta + length)
+		return {
+			"flops_fc_stack": fc_flops,
+			"flops_theta": 2 * batch_size * self.hidden_dim * 2 * self.n_theta,
+			"flops_basis": 2 * batch_size * self.n_theta * length,
+			"activation_bytes": element_size * activations,
+		}
+
 	def forward(self, X):
 		theta = self.theta( self.fc_stack(X) )
 		backcast_theta, forecast_theta = torch.split(theta, self.n_theta, dim=-1)
@@ -0,0 +1,18 @@
+import torch
+
+_BASIS_CACHE = dict()
+
+def get_basis(kind, backcast, forecast, size, dtype, device, builder):
+	# One (backcast_basis, forecast_basis) pair per configuration, shared by every block
+	# and stack that asks for it. builder() returns the two float64 numpy bases.
+	key = (kind, backcast, forecast, size, dtype, torch.device(device))
+	if key not in _BASIS_CACHE:
+		backcast_basis, forecast_basis = builder()
+		_BASIS_CACHE[key] = (
+			torch.from_numpy(backcast_basis).to(dtype=dtype, device=device),
+			torch.from_numpy(forecast_basis).to(dtype=dtype, device=device),
+		)
+	return _BASIS_CACHE[key]
+
+def clear_basis_cache():
+	_BASIS_CACHE.clear()
@@ -0,0 +1,12 @@
+def fc_stack_cost(fc_stack, batch_size):
+	# Linear layers (float or dynamically quantized) cost 2 * in * out FLOPs per sample.
+	# Every layer output, Linear and ReLU alike, is counted as an activation.
+	flops = 0
+	activation_elements = 0
+	features = 0
+	for layer in fc_stack:
+		if hasattr(layer, "in_features"):
+			flops += 2 * batch_size * layer.in_features * layer.out_features
+			features = layer.out_features
+		activation_elements += batch_size * features
+	return flops, activation_elements
@@ -0,0 +1,81 @@
+from abc import abstractmethod
+
+import numpy as np
+import torch
+
+from .base import NBeatsBlock
+from .basis_cache import get_basis
+
+class FixedBasisBlock(NBeatsBlock):
+	# Base for blocks whose bases are fixed functions of time (trend, seasonality). The bases
+	# are shared non-persistent buffers rather than frozen Linear weights: one copy per
+	# configuration from the basis cache, never written to state_dict. Subclasses set
+	# BASIS_KIND (buffers are named backcast_<kind>_basis / forecast_<kind>_basis) and
+	# implement _get_basis(tt) and _basis_size().
+	BASIS_KIND = None
+
+	def __init__(self, backcast, forecast, n_layers, n_theta, hidden_dim):
+		super().__init__(
+			backcast=backcast, forecast=forecast, n_layers=n_layers,
+			n_theta=n_theta, hidden_dim=hidden_dim
+		)
+
+		self._register_basis(torch.get_default_dtype(), torch.device("cpu"))
+		self._register_load_state_dict_pre_hook(FixedBasisBlock._drop_legacy_basis_keys, with_module=True)
+
+	@abstractmethod
+	def _get_basis(self, tt):
+		pass
+
+	@abstractmethod
+	def _basis_size(self):
+		# The hyperparameter that, with backcast/forecast, determines the basis (cache key).
+		pass
+
+	@property
+	def _basis_names(self):
+		return f"backcast_{self.BASIS_KIND}_basis", f"forecast_{self.BASIS_KIND}_basis"
+
+	def _get_backcast_basis(self):
+		tt = np.arange(0, self.backcast) / self.backcast - 1.0
+		return self._get_basis(tt)
+
+	def _get_forecast_basis(self):
+		tt = np.arange(0, self.forecast) / self.forecast
+		return self._get_basis(tt)
+
+	def _register_basis(self, dtype, device):
+		bases = get_basis(
+			self.BASIS_KIND, self.backcast, self.forecast, self._basis_size(), dtype, device,
+			lambda: (self._get_backcast_basis(), self._get_forecast_basis())
+		)
+		for name, basis in zip(self._basis_names, bases):
+			self.register_buffer(name, basis, persistent=False)
+
+	def _apply(self, fn, recurse=True):
+		# Module._apply would give every block its own converted copy; re-attach the
+		# shared cached basis for the new dtype/device instead.
+		super()._apply(fn, recurse)
+		basis = getattr(self, self._basis_names[0])
+		self._register_basis(basis.dtype, basis.device)
+		return self
+
+	@staticmethod
+	def _drop_legacy_basis_keys(module, state_dict, prefix, *args, **kwargs):
+		# Checkpoints written before the bases became buffers stored them as Linear weights.
+		for name in module._basis_names:
+			state_dict.pop(f"{prefix}{name}.weight", None)
+
+	def get_basis_vectors(self):
+		backcast_basis, forecast_basis = self._get_basis_weights()
+		return backcast_basis.detach().cpu().numpy().T, forecast_basis.detach().cpu().numpy().T
+
+	def _get_basis_weights(self):
+		return tuple(getattr(self, name) for name in self._basis_names)
+
+	def forward(self, X):
+		backcast_theta, forecast_theta = super().forward(X)
+		backcast_basis, forecast_basis = self._get_basis_weights()
+		backcast = torch.nn.functional.linear(backcast_theta, backcast_basis)
+		forecast = torch.nn.functional.linear(forecast_theta, forecast_basis)
+		return backcast, forecast
@@ -0,0 +1,51 @@
+import torch
+import torch.nn
+
+from .cost import fc_stack_cost
+
+class FusedBlock(torch.nn.Module):
+	# The projection carries the folded basis, so only the MLP is quantized.
+	QUANTIZABLE_MODULES = ("fc_stack",)
+
+	def __init__(self, fc_stack, weight, backcast, forecast):
+		super().__init__()
+		self.backcast = backcast
+		self.forecast = forecast
+		self.fc_stack = fc_stack
+		self.projection = torch.nn.Linear(weight.shape[1], backcast + forecast, bias=False)
+		with torch.no_grad():
+			self.projection.weight.copy_(weight)
+
+	@classmethod
+	def from_block(cls, block):
+		# Fold theta -> basis into a single (backcast + forecast, hidden_dim) weight:
+		#   [backcast; forecast] = blockdiag(B_b, B_f) @ W_theta @ h
+		theta_weight = block.theta.weight.detach()
+		backcast_basis, forecast_basis = block._get_basis_weights()
+		dtype = theta_weight.dtype
+
+		theta_weight = theta_weight.to(torch.float64)
+		backcast_weight = backcast_basis.detach().to(torch.float64) @ theta_weight[:block.n_theta]
+		forecast_weight = forecast_basis.detach().to(torch.float64) @ theta_weight[block.n_theta:]
+		weight = torch.cat([backcast_weight, forecast_weight], dim=0).to(dtype)
+
+		return cls(block.fc_stack, weight, block.backcast, block.forecast)
+
+	def fuse(self):
+		# Already fused; lets fuse_for_inference run on fused models.
+		return self
+
+	def forward(self, X):
+		out = self.projection( self.fc_stack(X) )
+		backcast, forecast = torch.split(out, [self.backcast, self.forecast], dim=-1)
+		return backcast, forecast
+
+	def estimate_cost(self, batch_size, element_size=4):
+		fc_flops, fc_activations = fc_stack_cost(self.fc_stack, batch_size)
+		length = self.backcast + self.forecast
+		return {
+			"flops_fc_stack": fc_flops,
+			"flops_theta": 0,
+			"flops_basis": 2 * batch_size * self.projection.in_features * length,
+			"activation_bytes": element_size * (fc_activations + batch_size * length),
+		}
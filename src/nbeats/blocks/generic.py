@@ -17,6 +17,10 @@ class GenericBlock(NBeatsBlock):
 		forecast_vectors = self.forecast_learnable_basis.weight.detach().cpu().numpy()
 		return backcast_vectors.T, forecast_vectors.T
 
+	def _get_basis_weights(self):
+		# Read by NBeatsBlock.fuse: the learnable bases are folded like the fixed ones.
+		return self.backcast_learnable_basis.weight, self.forecast_learnable_basis.weight
+
 	def forward(self, X):
 		backcast_theta, forecast_theta = super().forward(X)
 		backcast = self.backcast_learnable_basis(backcast_theta)
@@ -0,0 +1,8 @@
+from .backtest import Backtester, BacktestResult
+from .early_exit import early_exit_report
+
+__all__ = [
+	"Backtester",
+	"BacktestResult",
+	"early_exit_report"
+]
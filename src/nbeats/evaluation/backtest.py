@@ -0,0 +1,137 @@
+import numpy as np
+import torch
+
+from ..utils import MultiSeriesWindowDataset
+
+class BacktestResult:
+	# Flat per-origin layout: row ii forecasts series series_index[ii] from position origins[ii]
+	# (the first forecasted step within that series).
+	def __init__(self, forecasts, targets, series_index, origins, scale=None):
+		self.forecasts = forecasts
+		self.targets = targets
+		self.series_index = series_index
+		self.origins = origins
+		self.scale = scale
+
+	def __len__(self):
+		return len(self.origins)
+
+	def get_series(self, series_idx):
+		rows = self.series_index == series_idx
+		return self.origins[rows], self.forecasts[rows], self.targets[rows]
+
+	def score(self):
+		# Per-origin scores with series_metrics, then averaged per series and overall.
+		from ts_datasets.utils import series_metrics
+
+		per_origin = series_metrics.evaluate_series(self.targets, self.forecasts)["per_series"]
+		if self.scale is not None:
+			per_origin["MASE"] = series_metrics.mase(self.targets, self.forecasts, None, scale=self.scale)
+
+		n_series = int(self.series_index.max()) + 1 if len(self) else 0
+		counts = np.bincount(self.series_index, minlength=n_series)
+		per_series = dict()
+		for name, scores in per_origin.items():
+			finite = np.isfinite(scores)
+			sums = np.bincount(self.series_index[finite], weights=scores[finite], minlength=n_series)
+			valid = np.bincount(self.series_index[finite], minlength=n_series)
+			with np.errstate(invalid="ignore", divide="ignore"):
+				per_series[name] = np.where(counts > 0, sums / valid, np.nan)
+
+		return {
+			"per_origin": per_origin,
+			"per_series": per_series,
+			"aggregate": {name: float(np.nanmean(scores)) for name, scores in per_origin.items()},
+		}
+
+
+class Backtester:
+	# Rolling-origin evaluation: every origin of every series is cut from one flat buffer
+	# (MultiSeriesWindowDataset), forecast in large inference-mode batches and written into
+	# preallocated (n_origins, horizon) arrays.
+	def __init__(self, model, stride=1, n_origins=None, batch_size=4096, seasonality=1, device=None):
+		if not isinstance(stride, int) or stride <= 0:
+			raise ValueError(f"stride must be a positive integer, got {stride!r}.")
+		if n_origins is not None and (not isinstance(n_origins, int) or n_origins <= 0):
+			raise ValueError(f"n_origins must be a positive integer or None, got {n_origins!r}.")
+
+		self.model = model
+		self.stride = stride
+		self.n_origins = n_origins
+		self.batch_size = batch_size
+		self.seasonality = seasonality
+		self.device = device
+
+		template = getattr(model, "_member_template", model)
+		self.backcast = template.backcast
+		self.forecast = template.forecast
+
+	def _as_dataset(self, series):
+		if isinstance(series, MultiSeriesWindowDataset):
+			if series.backcast != self.backcast or series.forecast != self.forecast or series.include_backcast_in_y:
+				raise ValueError("The dataset's backcast/forecast must match the model, without backcast in y.")
+			return series
+		if isinstance(series, (np.ndarray, torch.Tensor)) and series.ndim == 1:
+			series = [series]
+		return MultiSeriesWindowDataset(series, backcast=self.backcast, forecast=self.forecast)
+
+	def origin_indices(self, dataset):
+		# Global window indices, newest origin first per series and then every `stride` steps
+		# back (at most n_origins of them); returned in ascending order.
+		n_windows = np.diff(dataset.window_offsets)
+		n_per_series = np.where(n_windows > 0, (n_windows - 1) // self.stride + 1, 0)
+		if self.n_origins is not None:
+			n_per_series = np.minimum(n_per_series, self.n_origins)
+
+		series_index = np.repeat(np.arange(dataset.n_series), n_per_series)
+		rank = np.arange(n_per_series.sum()) - np.repeat(np.cumsum(n_per_series) - n_per_series, n_per_series)
+		last_window = dataset.window_offsets[1:] - 1
+		indices = last_window[series_index] - self.stride * (n_per_series[series_index] - 1 - rank)
+		return indices, series_index
+
+	def _mase_scale(self, dataset, series_index, origins):
+		# Full-history seasonal-naive MAE up to each origin, via per-series prefix sums.
+		m = self.seasonality
+		values = np.asarray(dataset.values, dtype=np.float64)
+		diffs = np.zeros_like(values)
+		diffs[m:] = np.abs(values[m:] - values[:-m])
+		# Differences spanning two series are not part of either history.
+		positions = np.arange(len(values)) - np.repeat(dataset.offsets[:-1], dataset.lengths)
+		diffs[positions < m] = 0.0
+		prefix = np.concatenate([[0.0], np.cumsum(diffs)])
+
+		starts = dataset.offsets[series_index]
+		totals = prefix[starts + origins] - prefix[starts]
+		count = origins - m
+		with np.errstate(invalid="ignore", divide="ignore"):
+			return np.where(count > 0, totals / np.maximum(count, 1), np.nan)
+
+	@torch.inference_mode()
+	def run(self, series):
+		# series: a 1D array (one series), a list of 1D arrays / (n_series, T) array, or a
+		# MultiSeriesWindowDataset built with the model's backcast/forecast.
+		dataset = self._as_dataset(series)
+		indices, series_index = self.origin_indices(dataset)
+		window_starts = np.asarray(dataset.window_starts)[indices]
+		origins = window_starts - dataset.offsets[series_index] + self.backcast
+
+		forecasts = np.empty((len(indices), self.forecast), dtype=np.float32)
+		targets = np.empty((len(indices), self.forecast), dtype=np.float32)
+
+		predict = getattr(self.model, "predict", self.model)
+		was_training = self.model.training
+		self.model.eval()
+		try:
+			for start in range(0, len(indices), self.batch_size):
+				stop = min(start + self.batch_size, len(indices))
+				X, y = dataset[indices[start:stop]]
+				X = torch.as_tensor(X, dtype=torch.float32)
+				if self.device is not None:
+					X = X.to(self.device, non_blocking=True)
+				forecasts[start:stop] = predict(X).float().cpu().numpy()
+				targets[start:stop] = np.asarray(y)
+		finally:
+			self.model.train(was_training)
+
+		scale = self._mase_scale(dataset, series_index, origins)
+		return BacktestResult(forecasts, targets, series_index, origins, scale=scale)
@@ -0,0 +1,52 @@
+import time
+
+import torch
+
+def _time(fn, n_repeats):
+	fn()
+	start = time.perf_counter()
+	for _ in range(n_repeats):
+		result = fn()
+	return result, 1000 * (time.perf_counter() - start) / n_repeats
+
+def early_exit_report(model, X, thresholds=(1e-3, 1e-2, 5e-2), criterion="residual", budget=None,
+		patience=1, y_true=None, n_repeats=5):
+	# Trades depth for accuracy: for every threshold, the share of block evaluations actually
+	# run, the mean exit depth, latency, and the error against the full-depth forecast
+	# (and against y_true when given), scored with ts_datasets' sMAPE.
+	from ts_datasets.utils import metrics
+
+	model.eval()
+	n_blocks = sum(len(stack.blocks) for stack in model.stacks)
+	with torch.inference_mode():
+		full, full_ms = _time(lambda: model(X), n_repeats)
+	full_np = full.float().cpu().numpy()
+
+	baseline = dict(threshold=0.0, compute_fraction=1.0, mean_blocks=float(n_blocks), latency_ms=full_ms,
+		mae_vs_full=0.0, smape_vs_full=0.0)
+	if y_true is not None:
+		y_np = torch.as_tensor(y_true).float().cpu().numpy()
+		baseline["smape"] = float(metrics.smape(y_np, full_np))
+	rows = [baseline]
+
+	for threshold in thresholds:
+		(forecast, blocks_executed), latency_ms = _time(
+			lambda: model.forward_early_exit(
+				X, threshold=threshold, criterion=criterion, budget=budget, patience=patience
+			),
+			n_repeats
+		)
+		forecast_np = forecast.float().cpu().numpy()
+		row = dict(
+			threshold=threshold,
+			compute_fraction=blocks_executed.sum().item() / (len(X) * n_blocks),
+			mean_blocks=blocks_executed.float().mean().item(),
+			latency_ms=latency_ms,
+			mae_vs_full=float(metrics.mae(full_np, forecast_np)),
+			smape_vs_full=float(metrics.smape(full_np, forecast_np)),
+		)
+		if y_true is not None:
+			row["smape"] = float(metrics.smape(y_np, forecast_np))
+			row["smape_cost"] = row["smape"] - baseline["smape"]
+		rows.append(row)
+	return rows
@@ -1,10 +1,13 @@
 from .base import NBeatsModelBase
 from .generic import NBeatsGeneric
 from .interpretable import NBeatsInterpretable
+from .ensemble import NBeatsEnsemble, EnsembleOptimizer
 
 __all__ = [ 
 	"NBeatsModelBase",
 	"NBeatsGeneric",
-	"NBeatsInterpretable"
+	"NBeatsInterpretable",
+	"NBeatsEnsemble",
+	"EnsembleOptimizer"
 ]
 
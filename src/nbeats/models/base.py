@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+import copy
+import warnings
 
-import numpy as np
 import torch.nn
 
+from ..utils import IntermediateCapture, ModelProfiler
+
 class NBeatsModelBase(torch.nn.Module, ABC):
 	def __init__(self):
 		super().__init__()
@@ -12,33 +15,132 @@ class NBeatsModelBase(torch.nn.Module, ABC):
 	def _build_stacks(self):
 		pass
 
-	def forward(self, X, return_intermediates=False):
-		all_backcasts = []
-		all_forecasts = []
-		all_residuals = []
-		stack_forecasts = []
+	@abstractmethod
+	def get_config(self):
+		pass
 
-		forecast_sum = None
-		residual = X
+	def _unique_blocks(self):
+		seen = set()
+		for stack in self.stacks:
+			for block in stack.blocks:
+				if id(block) not in seen:
+					seen.add(id(block))
+					yield block
+
+	def fuse_for_inference(self):
+		# Every block type (generic, trend, seasonality) folds theta -> basis; fused blocks
+		# are kept as-is, so fusing an already fused model only warns.
+		from ..blocks import FusedBlock
+
+		if all(isinstance(block, FusedBlock) for block in self._unique_blocks()):
+			warnings.warn("Model is already fused; returning an unchanged copy.", UserWarning, stacklevel=2)
+		model = copy.deepcopy(self)
+		for stack in model.stacks:
+			stack.fuse_blocks()
+		model.requires_grad_(False)
+		return model.eval()
+
+	def quantize_for_inference(self, dtype=torch.qint8):
+		qconfigs = {
+			torch.qint8: torch.ao.quantization.default_dynamic_qconfig,
+			torch.float16: torch.ao.quantization.float16_dynamic_qconfig,
+		}
+		if dtype not in qconfigs:
+			raise ValueError(f"dtype must be torch.qint8 or torch.float16, got {dtype!r}.")
+
+		model = copy.deepcopy(self).cpu().eval()
+		for block in model._unique_blocks():
+			qconfig_spec = {name: qconfigs[dtype] for name in block.QUANTIZABLE_MODULES}
+			torch.ao.quantization.quantize_dynamic(block, qconfig_spec, dtype=dtype, inplace=True)
+		model.requires_grad_(False)
+		return model
+
+	def estimate_cost(self, batch_size, element_size=4):
+		cost = dict()
 		for stack in self.stacks:
-			res = stack(residual, return_intermediates=return_intermediates)
-			if return_intermediates:
-				backcast_list, forecast_list, residual_list, residual, forecast = res
-				all_backcasts.append(backcast_list)
-				all_forecasts.append(forecast_list)
-				all_residuals.append(residual_list)
-				stack_forecasts.append(forecast.detach().cpu().numpy())
+			for key, value in stack.estimate_cost(batch_size, element_size).items():
+				cost[key] = cost.get(key, 0) + value
+		return cost
+
+	def profile(self, record_functions=True):
+		return ModelProfiler(self, record_functions=record_functions)
+
+	def build_capture(self, keep=IntermediateCapture.KINDS):
+		n_blocks = max(len(stack.blocks) for stack in self.stacks)
+		return IntermediateCapture(n_stacks=len(self.stacks), n_blocks=n_blocks, keep=keep)
+
+	@torch.inference_mode()
+	def forward_early_exit(self, X, threshold=1e-2, criterion="residual", budget=None, min_blocks=1, patience=1):
+		# Adaptive-depth inference over the flattened block chain. After each block, a sample
+		# leaves the active batch when its relative residual energy (||residual||^2 / ||X||^2,
+		# criterion="residual") or relative forecast increment (||forecast|| / ||forecast_sum||,
+		# criterion="increment") has been below threshold for `patience` consecutive blocks
+		# (increments are not monotone along the chain). budget caps the block evaluations at that
+		# fraction of the full pass (every sample still runs the first block); when it binds,
+		# the samples with the largest criterion value run first.
+		# Returns (forecast, blocks_executed per sample).
+		if criterion not in ("residual", "increment"):
+			raise ValueError(f"criterion must be 'residual' or 'increment', got {criterion!r}.")
+		if budget is not None and not 0 < budget <= 1:
+			raise ValueError(f"budget must be in (0, 1] or None, got {budget!r}.")
+
+		blocks = [block for stack in self.stacks for block in stack.blocks]
+		batch_size = X.shape[0]
+		remaining = batch_size * len(blocks)
+		if budget is not None:
+			remaining = max(int(budget * remaining), batch_size)
+
+		active = torch.arange(batch_size, device=X.device)
+		residual = X
+		input_energy = X.square().sum(-1).clamp(min=1e-12)
+		forecast_sum = None
+		blocks_executed = torch.zeros(batch_size, dtype=torch.int64, device=X.device)
+		scores = None
+		n_below = torch.zeros(batch_size, dtype=torch.int64, device=X.device)
+
+		for depth, block in enumerate(blocks):
+			if len(active) == 0 or remaining <= 0:
+				break
+			if len(active) > remaining:
+				keep = scores.topk(remaining).indices
+				active, residual, n_below = active[keep], residual[keep], n_below[keep]
+
+			backcast, forecast = block(residual)
+			residual = residual - backcast
+			if forecast_sum is None:
+				forecast_sum = torch.zeros((batch_size, forecast.shape[-1]), dtype=forecast.dtype, device=X.device)
+			forecast_sum.index_add_(0, active, forecast)
+			blocks_executed[active] += 1
+			remaining -= len(active)
+
+			if criterion == "residual":
+				scores = residual.square().sum(-1) / input_energy[active]
 			else:
-				residual, forecast = res
+				scores = forecast.norm(dim=-1) / forecast_sum[active].norm(dim=-1).clamp(min=1e-12)
+			n_below = torch.where(scores < threshold, n_below + 1, 0)
+			if depth + 1 >= min_blocks:
+				keep = n_below < patience
+				active, residual, scores, n_below = active[keep], residual[keep], scores[keep], n_below[keep]
+
+		return forecast_sum, blocks_executed
+
+	def forward(self, X, return_intermediates=False, capture=None):
+		if return_intermediates and capture is None:
+			capture = self.build_capture()
+
+		forecast_sum = None
+		residual = X
+		for stack_idx, stack in enumerate(self.stacks):
+			residual, forecast = stack(residual, capture=capture, stack_idx=stack_idx)
 			if forecast_sum is None:
 				forecast_sum = torch.zeros_like(forecast)
 			forecast_sum += forecast
 
 		if return_intermediates:
-			all_backcasts = np.moveaxis(np.asarray(all_backcasts), 2, 0)
-			all_forecasts = np.moveaxis(np.asarray(all_forecasts), 2, 0)
-			all_residuals = np.moveaxis(np.asarray(all_residuals), 2, 0)
+			arrays = capture.to_numpy(batch_first=True)
+			all_backcasts, all_forecasts, all_residuals = (
+				arrays.get(kind) for kind in IntermediateCapture.KINDS
+			)
 			return all_backcasts, all_forecasts, all_residuals, forecast_sum
 		else:
 			return forecast_sum
-
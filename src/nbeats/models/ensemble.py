@@ -0,0 +1,167 @@
+import copy
+
+import torch
+import torch.nn
+from torch.func import functional_call, stack_module_state, vmap
+
+from .base import NBeatsModelBase
+
+class NBeatsEnsemble(torch.nn.Module):
+	def __init__(self, members):
+		super().__init__()
+		self.n_members = len(members)
+		self._validate_members(members)
+
+		params, buffers = stack_module_state(members)
+		self._param_names = list(params)
+		self._buffer_names = list(buffers)
+		self.member_params = torch.nn.ParameterList([
+			torch.nn.Parameter(params[name], requires_grad=params[name].requires_grad)
+			for name in self._param_names
+		])
+		persistent = members[0].state_dict().keys()
+		for ii, name in enumerate(self._buffer_names):
+			self.register_buffer(f"member_buffer_{ii}", buffers[name], persistent=name in persistent)
+
+		# Shared-weight stacks repeat one block object; functional_call does not restore
+		# repeated modules correctly, so the template gets one block per position and the
+		# shared tensor is passed under every alias instead. Cached bases are shared
+		# buffers even without shared weights, so buffers are aliased the same way.
+		self._aliases = dict()
+		self._buffer_aliases = dict()
+		canonical = dict()
+		for name, param in members[0].named_parameters(remove_duplicate=False):
+			self._aliases[name] = canonical.setdefault(id(param), name)
+		for name, buffer in members[0].named_buffers(remove_duplicate=False):
+			self._buffer_aliases[name] = canonical.setdefault(id(buffer), name)
+
+		member_template = copy.deepcopy(members[0]).to("meta")
+		template = copy.deepcopy(member_template)
+		for stack in template.stacks:
+			stack.blocks = torch.nn.ModuleList([copy.deepcopy(block) for block in stack.blocks])
+
+		# Stateless architecture for functional_call; kept out of the module tree so its
+		# (meta) tensors are not part of parameters()/state_dict().
+		object.__setattr__(self, "_template", template)
+		object.__setattr__(self, "_member_template", member_template)
+
+	@classmethod
+	def from_factory(cls, model_factory, seeds):
+		members = list()
+		for seed in seeds:
+			torch.manual_seed(seed)
+			members.append(model_factory())
+		return cls(members)
+
+	def _validate_members(self, members):
+		if self.n_members == 0:
+			raise ValueError("members must contain at least one model.")
+		for member in members:
+			if not isinstance(member, NBeatsModelBase):
+				raise TypeError(f"members must be NBeatsModelBase instances, got {type(member).__name__}.")
+
+		reference = {name: param.shape for name, param in members[0].named_parameters()}
+		for member in members[1:]:
+			shapes = {name: param.shape for name, param in member.named_parameters()}
+			if shapes != reference:
+				raise ValueError(
+					"All members must share the same architecture; build one ensemble per "
+					"configuration (e.g. per lookback) and aggregate their forecasts."
+				)
+
+	def _stacked_state(self):
+		params = dict(zip(self._param_names, self.member_params))
+		params = {alias: params[name] for alias, name in self._aliases.items()}
+		buffers = {
+			name: getattr(self, f"member_buffer_{ii}")
+			for ii, name in enumerate(self._buffer_names)
+		}
+		buffers = {alias: buffers[name] for alias, name in self._buffer_aliases.items()}
+		return params, buffers
+
+	def _member_forward(self, params, buffers, X):
+		return functional_call(self._template, (params, buffers), (X,), tie_weights=False)
+
+	def forward(self, X):
+		# X is either shared by all members, (batch, backcast), or given per member,
+		# (n_members, batch, backcast). Returns (n_members, batch, forecast).
+		params, buffers = self._stacked_state()
+		in_dim = 0 if X.ndim == 3 else None
+		return vmap(self._member_forward, in_dims=(0, 0, in_dim))(params, buffers, X)
+
+	def predict(self, X, aggregate="median"):
+		forecasts = self(X)
+		if aggregate == "median":
+			return forecasts.median(dim=0).values
+		elif aggregate == "mean":
+			return forecasts.mean(dim=0)
+		elif aggregate is None:
+			return forecasts
+		else:
+			raise ValueError(f"aggregate must be 'median', 'mean' or None, got {aggregate!r}.")
+
+	def loss(self, forecasts, y_true, loss_fns):
+		# One loss per member (e.g. sMAPE/MASE/MAPE as in the N-BEATS ensemble). Members
+		# do not share parameters, so the summed loss yields independent member gradients.
+		if callable(loss_fns):
+			loss_fns = [loss_fns] * self.n_members
+		if len(loss_fns) != self.n_members:
+			raise ValueError(f"Expected {self.n_members} loss functions, got {len(loss_fns)}.")
+
+		y_true = y_true.expand_as(forecasts) if y_true.ndim == 2 else y_true
+		losses = torch.stack([
+			loss_fn(forecasts[ii], y_true[ii]) for ii, loss_fn in enumerate(loss_fns)
+		])
+		return losses.sum(), losses.detach()
+
+	def get_member(self, member_idx):
+		params, buffers = self._stacked_state()
+		member = copy.deepcopy(self._member_template).to_empty(device=self.member_params[0].device)
+		persistent = member.state_dict().keys()
+		state = {
+			name: tensor[member_idx] for name, tensor in {**params, **buffers}.items()
+			if name in persistent
+		}
+		member.load_state_dict(state)
+		return member
+
+
+class EnsembleOptimizer:
+	def __init__(self, ensemble, optimizer_cls=torch.optim.Adam, lr=1e-3, **optimizer_kwargs):
+		# Stacked parameters are optimized by a single optimizer; per-member learning
+		# rates are applied by rescaling each member's slice of the update after step().
+		self.ensemble = ensemble
+		self.params = [param for param in ensemble.member_params if param.requires_grad]
+
+		if isinstance(lr, (int, float)):
+			self.member_lr = None
+			base_lr = lr
+		else:
+			member_lr = torch.as_tensor(lr, dtype=torch.float64)
+			if member_lr.shape != (ensemble.n_members,):
+				raise ValueError(f"lr must be a float or have one entry per member ({ensemble.n_members}).")
+			base_lr = float(member_lr.max())
+			self.member_lr = member_lr / base_lr
+
+		self.optimizer = optimizer_cls(self.params, lr=base_lr, **optimizer_kwargs)
+
+	def zero_grad(self, set_to_none=True):
+		self.optimizer.zero_grad(set_to_none=set_to_none)
+
+	def step(self):
+		if self.member_lr is None:
+			self.optimizer.step()
+			return
+
+		previous = [param.detach().clone() for param in self.params]
+		self.optimizer.step()
+		with torch.no_grad():
+			for param, old in zip(self.params, previous):
+				scale = self.member_lr.to(param.device, param.dtype).view(-1, *([1] * (param.ndim - 1)))
+				param.copy_(old + (param - old) * scale)
+
+	def state_dict(self):
+		return self.optimizer.state_dict()
+
+	def load_state_dict(self, state_dict):
+		self.optimizer.load_state_dict(state_dict)
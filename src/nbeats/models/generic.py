@@ -23,6 +23,18 @@ class NBeatsGeneric(NBeatsModelBase):
         self.shared_weights = shared_weights
         super().__init__()
 
+    def get_config(self):
+        return dict(
+            n_stacks=self.n_stacks,
+            n_blocks=self.n_blocks,
+            backcast=self.backcast,
+            forecast=self.forecast,
+            n_layers=self.n_layers,
+            n_theta=self.n_theta,
+            hidden_dim=self.hidden_dim,
+            shared_weights=self.shared_weights
+        )
+
     def _build_stacks(self):
         return [
             GenericStack(
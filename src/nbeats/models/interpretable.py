@@ -23,6 +23,18 @@ class NBeatsInterpretable(NBeatsModelBase):
         self.shared_weights = shared_weights
         super().__init__()
 
+    def get_config(self):
+        return dict(
+            n_blocks=self.n_blocks,
+            backcast=self.backcast,
+            forecast=self.forecast,
+            n_layers=self.n_layers,
+            degree=self.degree,
+            n_harmonics=self.n_harmonics,
+            hidden_dim=self.hidden_dim,
+            shared_weights=self.shared_weights
+        )
+
     def _build_stacks(self):
         return [
             TrendStack(
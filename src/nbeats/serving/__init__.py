@@ -0,0 +1,13 @@
+from .micro_batcher import MicroBatcher, ServingStats
+from .server import ForecastServer
+from .streaming import StreamingForecaster
+from .load_generator import run_load, synthetic_windows
+
+__all__ = [
+	"MicroBatcher",
+	"ServingStats",
+	"ForecastServer",
+	"StreamingForecaster",
+	"run_load",
+	"synthetic_windows"
+]
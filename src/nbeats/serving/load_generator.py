@@ -0,0 +1,74 @@
+import asyncio
+import json
+import time
+
+import numpy as np
+
+def synthetic_windows(n_windows, backcast, seed=42):
+	from ts_datasets.datasets.synthetic import Synthetic
+
+	n_periods = max(20, (n_windows + backcast) // 10 + 1)
+	series = Synthetic.generate_data(n_periods=n_periods, n_samples_per_period=10, seed=seed)["series"].to_numpy()
+	random = np.random.default_rng(seed=seed)
+	starts = random.integers(0, len(series) - backcast + 1, size=n_windows)
+	return np.stack([series[start : start + backcast] for start in starts]).astype(np.float32)
+
+
+async def _http_client(host, port, windows, latencies):
+	reader, writer = await asyncio.open_connection(host, port)
+	try:
+		for window in windows:
+			body = json.dumps({"series": window.tolist()}).encode()
+			start = time.perf_counter()
+			writer.write(
+				f"POST /forecast HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+				f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+			)
+			await writer.drain()
+
+			status_line = await reader.readline()
+			length = 0
+			while True:
+				line = await reader.readline()
+				if line in (b"\r\n", b""):
+					break
+				name, _, value = line.decode("latin-1").partition(":")
+				if name.strip().lower() == "content-length":
+					length = int(value)
+			await reader.readexactly(length)
+			if b" 200 " not in status_line:
+				raise RuntimeError(f"Forecast request failed: {status_line.decode().strip()}")
+			latencies.append(time.perf_counter() - start)
+	finally:
+		writer.close()
+
+async def _batcher_client(batcher, windows, latencies):
+	for window in windows:
+		start = time.perf_counter()
+		await batcher.forecast(window)
+		latencies.append(time.perf_counter() - start)
+
+async def run_load(target, n_requests=1000, concurrency=32, seed=42):
+	# target is a MicroBatcher (in-process) or a started ForecastServer (over HTTP).
+	from .server import ForecastServer
+
+	batcher = target.batcher if isinstance(target, ForecastServer) else target
+	windows = synthetic_windows(n_requests, batcher.backcast, seed=seed)
+	shards = np.array_split(windows, concurrency)
+
+	latencies = list()
+	start = time.perf_counter()
+	if isinstance(target, ForecastServer):
+		clients = [_http_client(target.host, target.port, shard, latencies) for shard in shards]
+	else:
+		clients = [_batcher_client(target, shard, latencies) for shard in shards]
+	await asyncio.gather(*clients)
+	elapsed = time.perf_counter() - start
+
+	latencies = np.asarray(latencies) * 1000
+	return {
+		"requests_per_sec": n_requests / elapsed,
+		"client_latency_ms_p50": float(np.percentile(latencies, 50)),
+		"client_latency_ms_p99": float(np.percentile(latencies, 99)),
+		"server": batcher.stats.summary(),
+	}
@@ -0,0 +1,124 @@
+import asyncio
+import collections
+import time
+
+import numpy as np
+import torch
+
+class ServingStats:
+	# Counts cover every request; latency/queue-time percentiles cover the most recent
+	# max_samples requests, so memory stays bounded in a long-running server.
+	def __init__(self, max_samples=100_000):
+		self.max_samples = max_samples
+		self.reset()
+
+	def reset(self):
+		self.queue_times = collections.deque(maxlen=self.max_samples)
+		self.latencies = collections.deque(maxlen=self.max_samples)
+		self.batch_sizes = collections.Counter()
+		self.n_requests = 0
+
+	def record_batch(self, batch_size):
+		self.batch_sizes[batch_size] += 1
+
+	def record_request(self, queue_time, latency):
+		self.queue_times.append(queue_time)
+		self.latencies.append(latency)
+		self.n_requests += 1
+
+	def summary(self):
+		latencies = np.asarray(self.latencies) * 1000
+		queue_times = np.asarray(self.queue_times) * 1000
+		n_batches = sum(self.batch_sizes.values())
+		return {
+			"n_requests": self.n_requests,
+			"n_batches": n_batches,
+			"mean_batch_size": self.n_requests / n_batches if n_batches else 0.0,
+			"batch_size_histogram": dict(sorted(self.batch_sizes.items())),
+			"queue_ms_mean": float(queue_times.mean()) if len(queue_times) else 0.0,
+			"latency_ms_p50": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+			"latency_ms_p99": float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+		}
+
+
+class MicroBatcher:
+	def __init__(self, model, max_batch_size=64, max_wait_ms=2.0):
+		self.model = model.eval()
+		self.max_batch_size = max_batch_size
+		self.max_wait_ms = max_wait_ms
+		self.backcast = model.stacks[0].backcast
+
+		self._validate_params()
+
+		self.stats = ServingStats()
+		self._queue = None
+		self._worker = None
+
+	def _validate_params(self):
+		if not isinstance(self.max_batch_size, int) or self.max_batch_size <= 0:
+			raise ValueError(f"max_batch_size must be a positive integer, got {self.max_batch_size!r}.")
+		if not isinstance(self.max_wait_ms, (int, float)) or self.max_wait_ms < 0:
+			raise ValueError(f"max_wait_ms must be a non-negative number, got {self.max_wait_ms!r}.")
+
+	async def start(self):
+		if self._worker is None:
+			self._queue = asyncio.Queue()
+			self._worker = asyncio.create_task(self._run())
+
+	async def stop(self):
+		if self._worker is not None:
+			self._worker.cancel()
+			try:
+				await self._worker
+			except asyncio.CancelledError:
+				pass
+			self._worker = None
+
+	async def forecast(self, series):
+		series = np.asarray(series, dtype=np.float32).reshape(-1)
+		if len(series) < self.backcast:
+			raise ValueError(f"series must have at least backcast={self.backcast} points, got {len(series)}.")
+
+		await self.start()
+		future = asyncio.get_running_loop().create_future()
+		await self._queue.put((series[-self.backcast:], time.perf_counter(), future))
+		return await future
+
+	async def _collect(self):
+		# Block for the first request, then coalesce until the batch is full or max_wait expires.
+		batch = [await self._queue.get()]
+		deadline = time.perf_counter() + self.max_wait_ms / 1000
+		while len(batch) < self.max_batch_size:
+			timeout = deadline - time.perf_counter()
+			if timeout <= 0:
+				break
+			try:
+				batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+			except asyncio.TimeoutError:
+				break
+		return batch
+
+	def _predict(self, X):
+		with torch.inference_mode():
+			return self.model(torch.from_numpy(X)).numpy()
+
+	async def _run(self):
+		loop = asyncio.get_running_loop()
+		while True:
+			batch = await self._collect()
+			dispatch_time = time.perf_counter()
+			X = np.stack([window for window, _, _ in batch])
+			try:
+				forecasts = await loop.run_in_executor(None, self._predict, X)
+			except Exception as e:
+				for _, _, future in batch:
+					if not future.done():
+						future.set_exception(e)
+				continue
+
+			done_time = time.perf_counter()
+			self.stats.record_batch(len(batch))
+			for (_, enqueue_time, future), forecast in zip(batch, forecasts):
+				self.stats.record_request(dispatch_time - enqueue_time, done_time - enqueue_time)
+				if not future.done():
+					future.set_result(forecast)
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import logging
+
+from .micro_batcher import MicroBatcher
+
+REASONS = {
+	200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large", 500: "Internal Server Error"
+}
+
+class RequestError(ValueError):
+	# Malformed request framing; answered with `status`, then the connection is closed.
+	def __init__(self, status, message):
+		super().__init__(message)
+		self.status = status
+
+
+class ForecastServer:
+	# Minimal HTTP/1.1 front end over a MicroBatcher:
+	#   POST /forecast  {"series": [...]}  ->  {"forecast": [...]}
+	#   GET  /stats                        ->  ServingStats.summary()
+	def __init__(
+		self, model, host="127.0.0.1", port=0, max_batch_size=64, max_wait_ms=2.0, max_body_bytes=1024 * 1024
+	):
+		self.batcher = MicroBatcher(model, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+		self.host = host
+		self.port = port
+		self.max_body_bytes = max_body_bytes
+		self.logger = logging.getLogger(__name__)
+		self._server = None
+
+	async def start(self):
+		await self.batcher.start()
+		self._server = await asyncio.start_server(self._handle, self.host, self.port)
+		self.port = self._server.sockets[0].getsockname()[1]
+		return self
+
+	async def stop(self):
+		if self._server is not None:
+			self._server.close()
+			await self._server.wait_closed()
+			self._server = None
+		await self.batcher.stop()
+
+	async def serve_forever(self):
+		await self.start()
+		async with self._server:
+			await self._server.serve_forever()
+
+	async def _read_request(self, reader):
+		request_line = await reader.readline()
+		if not request_line:
+			return None
+		parts = request_line.decode("latin-1").split()
+		if len(parts) != 3:
+			raise RequestError(400, f"Malformed request line: {request_line[:100]!r}")
+		method, path, _ = parts
+
+		headers = dict()
+		while True:
+			line = await reader.readline()
+			if line in (b"\r\n", b"\n", b""):
+				break
+			name, _, value = line.decode("latin-1").partition(":")
+			headers[name.strip().lower()] = value.strip()
+
+		content_length = headers.get("content-length", "0")
+		if not content_length.isdigit():
+			raise RequestError(400, f"Invalid Content-Length: {content_length[:100]!r}")
+		if int(content_length) > self.max_body_bytes:
+			raise RequestError(413, f"Content-Length {content_length} exceeds {self.max_body_bytes} bytes.")
+		body = await reader.readexactly(int(content_length))
+		return method, path, headers, body
+
+	async def _dispatch(self, method, path, body):
+		if method == "POST" and path == "/forecast":
+			payload = json.loads(body)
+			if not isinstance(payload, dict) or "series" not in payload:
+				raise ValueError('Body must be a JSON object with a "series" list.')
+			series = payload["series"]
+			if not isinstance(series, list) or not all(
+				isinstance(value, (int, float)) and not isinstance(value, bool) for value in series
+			):
+				raise ValueError('"series" must be a list of numbers.')
+			forecast = await self.batcher.forecast(series)
+			return 200, {"forecast": forecast.tolist()}
+		elif method == "GET" and path == "/stats":
+			return 200, self.batcher.stats.summary()
+		else:
+			return 404, {"error": f"Unknown endpoint: {method} {path}"}
+
+	async def _respond(self, writer, status, payload):
+		data = json.dumps(payload).encode()
+		writer.write(
+			f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+			f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+		)
+		await writer.drain()
+
+	async def _handle(self, reader, writer):
+		try:
+			while True:
+				try:
+					request = await self._read_request(reader)
+				except RequestError as e:
+					# The rest of the stream cannot be framed; answer and drop the connection.
+					await self._respond(writer, e.status, {"error": str(e)})
+					break
+				if request is None:
+					break
+				method, path, headers, body = request
+				try:
+					status, payload = await self._dispatch(method, path, body)
+				except (ValueError, KeyError, TypeError) as e:
+					status, payload = 400, {"error": str(e)}
+				except Exception as e:
+					# e.g. the model failing inside the batcher; the connection stays usable.
+					self.logger.exception("Forecast request failed")
+					status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+
+				await self._respond(writer, status, payload)
+				if headers.get("connection", "").lower() == "close":
+					break
+		except (asyncio.IncompleteReadError, ConnectionResetError):
+			pass
+		finally:
+			writer.close()
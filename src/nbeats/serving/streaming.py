@@ -0,0 +1,88 @@
+import numpy as np
+import torch
+
+class StreamingForecaster:
+	# Keeps the last `backcast` observations of n_series series in one (n_series, backcast)
+	# ring buffer. Appends write a single slot per series (O(1), no reallocation); forecast()
+	# reorders the full windows with one gather and runs one batched forward over them.
+	def __init__(self, model, n_series, device=None, dtype=torch.float32):
+		if not isinstance(n_series, int) or n_series <= 0:
+			raise ValueError(f"n_series must be a positive integer, got {n_series!r}.")
+
+		self.model = model.eval()
+		self.n_series = n_series
+		template = getattr(model, "_member_template", model)
+		self.backcast = template.backcast
+		self.forecast_length = template.forecast
+		self._predict = getattr(model, "predict", model)
+
+		self.device = torch.device(device) if device is not None else next(model.parameters()).device
+		self.buffer = torch.zeros((n_series, self.backcast), dtype=dtype, device=self.device)
+		self.heads = torch.zeros(n_series, dtype=torch.int64, device=self.device)
+		self.counts = torch.zeros(n_series, dtype=torch.int64, device=self.device)
+		self._steps = torch.arange(self.backcast, device=self.device)
+
+	def _as_index(self, series_indices):
+		if series_indices is None:
+			return torch.arange(self.n_series, device=self.device)
+		index = torch.as_tensor(series_indices, dtype=torch.int64, device=self.device).reshape(-1)
+		if len(index) and (index.min() < 0 or index.max() >= self.n_series):
+			raise IndexError(f"series indices must be in [0, {self.n_series}).")
+		return index
+
+	def append(self, series_idx, value):
+		# One new observation for one series.
+		head = int(self.heads[series_idx])
+		self.buffer[series_idx, head] = value
+		self.heads[series_idx] = (head + 1) % self.backcast
+		self.counts[series_idx] = min(int(self.counts[series_idx]) + 1, self.backcast)
+
+	def update(self, values, series_indices=None):
+		# One new observation for each listed series (default: all series, in order).
+		index = self._as_index(series_indices)
+		values = torch.as_tensor(values, dtype=self.buffer.dtype, device=self.device).reshape(-1)
+		if len(values) != len(index):
+			raise ValueError(f"Expected {len(index)} values, got {len(values)}.")
+		if series_indices is not None and len(torch.unique(index)) != len(index):
+			raise ValueError("series_indices must not contain duplicates; call update() once per tick.")
+
+		heads = self.heads[index]
+		self.buffer[index, heads] = values
+		self.heads[index] = (heads + 1) % self.backcast
+		self.counts[index] = torch.clamp(self.counts[index] + 1, max=self.backcast)
+
+	def load_history(self, history, series_indices=None):
+		# Warm start from (n, T) histories; only the last `backcast` points are kept.
+		index = self._as_index(series_indices)
+		history = torch.as_tensor(np.asarray(history), dtype=self.buffer.dtype, device=self.device)
+		history = history.reshape(len(index), -1)[:, -self.backcast:]
+		n_points = history.shape[1]
+		self.buffer[index] = 0
+		self.buffer[index, :n_points] = history
+		self.heads[index] = n_points % self.backcast
+		self.counts[index] = n_points
+
+	def reset(self, series_indices=None):
+		index = self._as_index(series_indices)
+		self.buffer[index] = 0
+		self.heads[index] = 0
+		self.counts[index] = 0
+
+	def ready(self):
+		return torch.nonzero(self.counts == self.backcast).reshape(-1)
+
+	def windows(self, series_indices=None):
+		# Chronologically ordered (n, backcast) windows; the oldest point sits at the head.
+		index = self._as_index(series_indices)
+		order = (self.heads[index, None] + self._steps) % self.backcast
+		return self.buffer[index].gather(1, order)
+
+	@torch.inference_mode()
+	def forecast(self, series_indices=None):
+		# Returns (series_indices, forecasts) for the requested series whose window is full.
+		index = self.ready() if series_indices is None else self._as_index(series_indices)
+		if series_indices is not None:
+			index = index[self.counts[index] == self.backcast]
+		if len(index) == 0:
+			return index, self.buffer.new_empty((0, self.forecast_length))
+		return index, self._predict(self.windows(index))
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 import torch
 import torch.nn
 
+from ..utils import IntermediateCapture
+
 class NBeatsStack(torch.nn.Module, ABC):
 	def __init__(self, n_blocks, backcast, forecast, n_layers, n_theta, hidden_dim, shared_weights):
 		super().__init__()
@@ -46,28 +48,48 @@ class NBeatsStack(torch.nn.Module, ABC):
 	def _build_block(self):
 		pass
 
-	def forward(self, X, return_intermediates=False):
-		backcast_list = list()
-		forecast_list = list()
-		residual_list = list()
-		
+	def fuse_blocks(self):
+		# Preserve weight sharing: a block repeated in the list is fused once.
+		fused = dict()
+		for block in self.blocks:
+			if id(block) not in fused:
+				fused[id(block)] = block.fuse()
+		self.blocks = torch.nn.ModuleList([
+			fused[id(block)] for block in self.blocks
+		])
+		return self
+
+	def estimate_cost(self, batch_size, element_size=4):
+		cost = dict()
+		for block in self.blocks:
+			for key, value in block.estimate_cost(batch_size, element_size).items():
+				cost[key] = cost.get(key, 0) + value
+		return cost
+
+	def forward(self, X, return_intermediates=False, capture=None, stack_idx=0):
+		if return_intermediates and capture is None:
+			capture = IntermediateCapture(n_stacks=1, n_blocks=len(self.blocks))
+			stack_idx = 0
+
 		forecast_sum = None
 		residual = X
-		for block in self.blocks:
+		for block_idx, block in enumerate(self.blocks):
 			backcast, forecast = block(residual)
 
 			residual = residual - backcast
 			if forecast_sum is None:
 				forecast_sum = torch.zeros_like(forecast)
 			forecast_sum += forecast
-		
-			if return_intermediates:
-				backcast_list.append(backcast.detach().cpu().numpy())
-				forecast_list.append(forecast.detach().cpu().numpy())
-				residual_list.append(residual.detach().cpu().numpy())
+
+			if capture is not None:
+				capture.record(stack_idx, block_idx, backcast, forecast, residual)
 
 		if return_intermediates:
+			arrays = capture.to_numpy(batch_first=False)
+			backcast_list, forecast_list, residual_list = (
+				None if arrays.get(kind) is None else list(arrays[kind][stack_idx])
+				for kind in IntermediateCapture.KINDS
+			)
 			return backcast_list, forecast_list, residual_list, residual, forecast_sum
 		else:
 			return residual, forecast_sum
-
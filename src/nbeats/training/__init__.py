@@ -0,0 +1,12 @@
+from .trainer import Trainer, TrainingStats
+from .sweep import SweepRunner, expand_grid
+from .distributed import DistributedTrainer, launch
+
+__all__ = [
+	"Trainer",
+	"TrainingStats",
+	"SweepRunner",
+	"expand_grid",
+	"DistributedTrainer",
+	"launch"
+]
@@ -0,0 +1,144 @@
+import os
+import pickle
+import socket
+
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+from torch.utils.data import BatchSampler, DataLoader
+from torch.utils.data.distributed import DistributedSampler
+
+from .trainer import Trainer
+
+def _free_port():
+	with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+		sock.bind(("127.0.0.1", 0))
+		return sock.getsockname()[1]
+
+def _launch_worker(rank, world_size, fn, args, port, threads_per_rank, backend, results):
+	os.environ["MASTER_ADDR"] = "127.0.0.1"
+	os.environ["MASTER_PORT"] = str(port)
+	if threads_per_rank is not None:
+		torch.set_num_threads(threads_per_rank)
+	dist.init_process_group(backend, rank=rank, world_size=world_size)
+	try:
+		result = fn(rank, world_size, *args)
+		if rank == 0:
+			# Plain pickle copies tensors; shared-memory handles would die with this process.
+			results.put(pickle.dumps(result))
+	finally:
+		dist.destroy_process_group()
+
+def launch(fn, world_size, args=(), threads_per_rank=None, backend="gloo"):
+	# Runs fn(rank, world_size, *args) in world_size local processes joined in one process
+	# group, and returns rank 0's return value. fn must be importable (spawn start method).
+	if threads_per_rank is None:
+		threads_per_rank = max(1, (os.cpu_count() or 1) // world_size)
+	results = mp.get_context("spawn").SimpleQueue()
+	context = mp.spawn(
+		_launch_worker,
+		args=(world_size, fn, args, _free_port(), threads_per_rank, backend, results),
+		nprocs=world_size,
+		join=False,
+	)
+	# Drain the result before joining: rank 0 blocks in put() until the pipe is read, so
+	# joining first deadlocks on results larger than the pipe buffer. A failing rank makes
+	# join() raise, so the result is polled while the processes are still alive.
+	result = None
+	while True:
+		if not results.empty():
+			result = pickle.loads(results.get())
+		if context.join(timeout=0.1):
+			break
+	if result is None and not results.empty():
+		result = pickle.loads(results.get())
+	return result
+
+
+class DistributedTrainer(Trainer):
+	# Data-parallel Trainer for an initialized process group (see launch). Every rank holds a
+	# full model replica; the window index is sharded across ranks each epoch and gradients
+	# are averaged with one flattened all_reduce per optimizer step. The model is not wrapped,
+	# so its state_dict (and save_checkpoint output) is identical to single-process training.
+	def __init__(self, model, *args, seed=0, **kwargs):
+		if not dist.is_initialized():
+			raise RuntimeError("DistributedTrainer requires an initialized process group; use launch().")
+		super().__init__(model, *args, **kwargs)
+		self.rank = dist.get_rank()
+		self.world_size = dist.get_world_size()
+		self.seed = seed
+		self._epoch = 0
+
+		# Start every replica from rank 0's weights.
+		with torch.no_grad():
+			for tensor in list(self.model.parameters()) + list(self.model.buffers()):
+				dist.broadcast(tensor, src=0)
+
+	@property
+	def is_main(self):
+		return self.rank == 0
+
+	def _build_loader(self, dataset):
+		# Each rank draws batch_size windows from its 1/world_size shard of the shuffled index,
+		# so the global batch is world_size * batch_size.
+		sampler = DistributedSampler(
+			dataset, num_replicas=self.world_size, rank=self.rank, shuffle=True, seed=self.seed
+		)
+		loader_kwargs = dict()
+		if self.num_workers > 0:
+			loader_kwargs.update(prefetch_factor=self.prefetch_factor, persistent_workers=True)
+		return DataLoader(
+			dataset,
+			sampler=BatchSampler(sampler, batch_size=self.batch_size, drop_last=False),
+			batch_size=None,
+			num_workers=self.num_workers,
+			**loader_kwargs
+		)
+
+	def train_epoch(self, loader):
+		loader.sampler.sampler.set_epoch(self._epoch)
+		self._epoch += 1
+		return super().train_epoch(loader)
+
+	def _all_reduce_gradients(self):
+		params = [param for param in self.model.parameters() if param.requires_grad]
+		grads = [param.grad if param.grad is not None else torch.zeros_like(param) for param in params]
+		flat = torch.cat([grad.reshape(-1) for grad in grads])
+		dist.all_reduce(flat)
+		flat /= self.world_size
+		averaged = torch.split(flat, [grad.numel() for grad in grads])
+		for param, grad in zip(params, averaged):
+			grad = grad.view_as(param)
+			if param.grad is None:
+				param.grad = grad
+			else:
+				param.grad.copy_(grad)
+
+	def _optimizer_step(self):
+		self._all_reduce_gradients()
+		super()._optimizer_step()
+
+	def evaluate(self, dataset):
+		# Each rank evaluates a contiguous shard; losses are summed across ranks.
+		self.model.eval()
+		shard = len(dataset) // self.world_size + (len(dataset) % self.world_size > 0)
+		begin, end = self.rank * shard, min((self.rank + 1) * shard, len(dataset))
+		totals = torch.zeros(2, dtype=torch.float64)
+		with torch.inference_mode():
+			for start in range(begin, end, self.eval_batch_size):
+				X, y = dataset[start : min(start + self.eval_batch_size, end)]
+				X, y = X.to(self.device), y.to(self.device)
+				loss = self._compute_loss(X, y)
+				totals[0] += loss.item() * len(X)
+				totals[1] += len(X)
+		dist.all_reduce(totals)
+		return (totals[0] / totals[1].clamp(min=1)).item()
+
+	def save_checkpoint(self, path):
+		# Written by rank 0 only; loadable with nbeats.utils.load_checkpoint in any process.
+		from ..utils import save_checkpoint
+
+		if self.is_main:
+			save_checkpoint(self.model, path)
+		dist.barrier()
+		return path
@@ -0,0 +1,202 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import itertools
+import logging
+import math
+import os
+import time
+
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+
+from ..models import NBeatsGeneric, NBeatsInterpretable
+from .trainer import Trainer
+
+MODEL_CLASSES = {cls.__name__: cls for cls in (NBeatsGeneric, NBeatsInterpretable)}
+TRAINER_KEYS = ("lr", "batch_size")
+RESULT_KEYS = (
+	"trial", "status", "epochs", "best_val_smape", "final_val_smape", "train_loss",
+	"n_params", "duration_s", "error"
+)
+
+def expand_grid(model_class, **param_grid):
+	# expand_grid("NBeatsGeneric", n_stacks=[2, 4], hidden_dim=[64, 128]) -> 4 trial dicts.
+	if model_class not in MODEL_CLASSES:
+		raise ValueError(f"model_class must be one of {sorted(MODEL_CLASSES)}, got {model_class!r}.")
+	names = list(param_grid)
+	return [
+		dict(model_class=model_class, **dict(zip(names, values)))
+		for values in itertools.product(*(param_grid[name] for name in names))
+	]
+
+def _share_memory(dataset):
+	# Moves the dataset's tensors (and the storages their window views point at) into shared
+	# memory, so worker processes map them instead of receiving pickled copies. NumPy-backed
+	# datasets (to_tensor=False) cannot be shared this way and are rejected by SweepRunner.
+	for value in vars(dataset).values():
+		if isinstance(value, torch.Tensor):
+			value.share_memory_()
+	return dataset
+
+# --- Worker process ---
+_WORKER = dict()
+
+def _init_worker(train_dataset, val_dataset, reports, threads_per_worker):
+	torch.set_num_threads(threads_per_worker)
+	try:
+		torch.set_num_interop_threads(1)
+	except RuntimeError:
+		pass
+	_WORKER.update(train_dataset=train_dataset, val_dataset=val_dataset, reports=reports)
+
+def _val_smape(model, dataset, batch_size):
+	from ts_datasets.utils.streaming_metrics import MetricAccumulator
+
+	accumulator = MetricAccumulator()
+	model.eval()
+	with torch.inference_mode():
+		for start in range(0, len(dataset), batch_size):
+			X, y = dataset[start : start + batch_size]
+			accumulator.update(y, model(X))
+	return accumulator.smape()
+
+def _should_prune(reports, epoch, smape, prune_after, prune_quantile, min_reports):
+	if epoch + 1 < prune_after:
+		return False
+	others = [value for (ep, value) in list(reports) if ep == epoch]
+	return len(others) >= min_reports and smape > np.quantile(others, prune_quantile)
+
+def _run_trial(trial_idx, trial, n_epochs, trainer_kwargs, prune_after, prune_quantile, min_reports, seed):
+	start = time.perf_counter()
+	row = dict(trial=trial_idx, status="completed", epochs=0, best_val_smape=math.nan,
+		final_val_smape=math.nan, train_loss=math.nan, n_params=0, duration_s=0.0, error="")
+	try:
+		train_dataset, val_dataset = _WORKER["train_dataset"], _WORKER["val_dataset"]
+		reports = _WORKER["reports"]
+		torch.manual_seed(seed + trial_idx)
+
+		config = {key: value for key, value in trial.items() if key != "model_class" and key not in TRAINER_KEYS}
+		model = MODEL_CLASSES[trial["model_class"]](
+			backcast=train_dataset.backcast, forecast=train_dataset.forecast, **config
+		)
+		kwargs = dict(trainer_kwargs, **{key: trial[key] for key in TRAINER_KEYS if key in trial})
+		trainer = Trainer(model, **kwargs)
+		loader = trainer._build_loader(train_dataset)
+		row["n_params"] = sum(param.numel() for param in model.parameters())
+
+		for epoch in range(n_epochs):
+			row["train_loss"] = trainer.train_epoch(loader)
+			smape = _val_smape(model, val_dataset, trainer.eval_batch_size)
+			row["epochs"] = epoch + 1
+			row["final_val_smape"] = smape
+			row["best_val_smape"] = smape if math.isnan(row["best_val_smape"]) else min(row["best_val_smape"], smape)
+
+			prune = _should_prune(reports, epoch, smape, prune_after, prune_quantile, min_reports)
+			reports.append((epoch, smape))
+			if prune:
+				row["status"] = "pruned"
+				break
+	except Exception as e:
+		row["status"] = "failed"
+		row["error"] = f"{type(e).__name__}: {e}"
+	row["duration_s"] = time.perf_counter() - start
+	return row
+
+
+class SweepRunner:
+	# Runs trials on a spawn-based process pool. Each worker pins torch to threads_per_worker
+	# threads; the window datasets are shared through shared memory; after prune_after epochs a
+	# trial stops when its validation sMAPE is above the prune_quantile of the sMAPEs other
+	# trials reported at the same epoch (median stopping). Only the parent process writes
+	# results, one row per finished trial, so concurrent trials never race on the results file.
+	def __init__(
+		self,
+		train_dataset,
+		val_dataset,
+		n_epochs=10,
+		n_workers=None,
+		threads_per_worker=1,
+		trainer_kwargs=None,
+		prune_after=1,
+		prune_quantile=0.5,
+		min_reports=3,
+		seed=0,
+	):
+		self.train_dataset = train_dataset
+		self.val_dataset = val_dataset
+		self.n_epochs = n_epochs
+		self.threads_per_worker = threads_per_worker
+		self.n_workers = n_workers or max(1, (os.cpu_count() or 1) // threads_per_worker)
+		self.trainer_kwargs = dict(trainer_kwargs or {})
+		self.prune_after = prune_after
+		self.prune_quantile = prune_quantile
+		self.min_reports = min_reports
+		self.seed = seed
+		self.logger = logging.getLogger(__name__)
+
+		self._validate_params()
+
+	def _validate_params(self):
+		for name in ["n_epochs", "n_workers", "threads_per_worker", "prune_after", "min_reports"]:
+			val = getattr(self, name)
+			if not isinstance(val, int) or val <= 0:
+				raise ValueError(f"{name} must be a positive integer, got {val!r}.")
+		if not 0 < self.prune_quantile <= 1:
+			raise ValueError(f"prune_quantile must be in (0, 1], got {self.prune_quantile!r}.")
+		if "num_threads" in self.trainer_kwargs:
+			raise ValueError("Set threads_per_worker instead of trainer_kwargs['num_threads'].")
+		for name in ["train_dataset", "val_dataset"]:
+			dataset = getattr(self, name)
+			if not getattr(dataset, "to_tensor", True):
+				raise TypeError(
+					f"{name} must be tensor-backed (to_tensor=True) to be shared with workers, "
+					f"got a NumPy-backed {type(dataset).__name__}."
+				)
+
+	def run(self, trials, dataset_manager=None, results_filename="sweep_results.csv"):
+		# trials: list of dicts with "model_class" plus constructor (and optional lr/batch_size)
+		# arguments, e.g. from expand_grid. Returns the result rows sorted by best_val_smape.
+		import pandas as pd
+
+		for trial in trials:
+			if trial.get("model_class") not in MODEL_CLASSES:
+				raise ValueError(f"Trial model_class must be one of {sorted(MODEL_CLASSES)}, got {trial!r}.")
+		# A fixed column set keeps appended CSV rows aligned across model classes.
+		param_keys = sorted({key for trial in trials for key in trial})
+		columns = list(RESULT_KEYS) + param_keys
+
+		_share_memory(self.train_dataset)
+		_share_memory(self.val_dataset)
+		trainer_kwargs = dict(self.trainer_kwargs, num_threads=self.threads_per_worker)
+
+		context = mp.get_context("spawn")
+		rows = list()
+		with context.Manager() as manager:
+			reports = manager.list()
+			with ProcessPoolExecutor(
+				max_workers=self.n_workers,
+				mp_context=context,
+				initializer=_init_worker,
+				initargs=(self.train_dataset, self.val_dataset, reports, self.threads_per_worker),
+			) as executor:
+				futures = {
+					executor.submit(
+						_run_trial, trial_idx, trial, self.n_epochs, trainer_kwargs,
+						self.prune_after, self.prune_quantile, self.min_reports, self.seed
+					): trial
+					for trial_idx, trial in enumerate(trials)
+				}
+				for future in as_completed(futures):
+					row = dict(future.result(), **futures[future])
+					rows.append(row)
+					self.logger.info(
+						f"trial {row['trial']} {row['status']} after {row['epochs']} epoch(s): "
+						f"best val sMAPE={row['best_val_smape']:.4f} ({row['duration_s']:.1f}s)"
+					)
+					if dataset_manager is not None:
+						dataset_manager.save_results_dataframe(
+							pd.DataFrame([row], columns=columns), results_filename,
+							append=len(rows) > 1, index=False, suppress_logs=True
+						)
+
+		return sorted(rows, key=lambda row: (math.isnan(row["best_val_smape"]), row["best_val_smape"]))
@@ -0,0 +1,239 @@
+import copy
+import logging
+import math
+import time
+
+import torch
+from torch.utils.data import BatchSampler, DataLoader, RandomSampler
+
+from ..models import NBeatsModelBase
+
+class TrainingStats:
+	def __init__(self):
+		self.reset()
+
+	def reset(self):
+		self.n_samples = 0
+		self.n_steps = 0
+		self.data_wait = 0.0
+		self.compute = 0.0
+		self.start = time.perf_counter()
+
+	def update(self, n_samples, data_wait, compute):
+		self.n_samples += n_samples
+		self.n_steps += 1
+		self.data_wait += data_wait
+		self.compute += compute
+
+	def summary(self):
+		elapsed = max(time.perf_counter() - self.start, 1e-12)
+		n_steps = max(self.n_steps, 1)
+		return {
+			"samples_per_sec": self.n_samples / elapsed,
+			"step_latency_ms": 1000 * self.compute / n_steps,
+			"data_wait_ms": 1000 * self.data_wait / n_steps,
+			"data_wait_fraction": self.data_wait / elapsed,
+		}
+
+
+class Trainer:
+	def __init__(
+		self,
+		model,
+		loss_fn=None,
+		optimizer=None,
+		lr=1e-3,
+		batch_size=1024,
+		eval_batch_size=None,
+		grad_accum_steps=1,
+		bf16=False,
+		num_threads=None,
+		num_workers=0,
+		prefetch_factor=2,
+		patience=None,
+		max_grad_norm=None,
+		log_every=0,
+	):
+		self.model = model
+		self.loss_fn = loss_fn or torch.nn.MSELoss()
+		self.lr = lr
+		self.batch_size = batch_size
+		self.eval_batch_size = eval_batch_size or batch_size
+		self.grad_accum_steps = grad_accum_steps
+		self.bf16 = bf16
+		self.num_threads = num_threads
+		self.num_workers = num_workers
+		self.prefetch_factor = prefetch_factor
+		self.patience = patience
+		self.max_grad_norm = max_grad_norm
+		self.log_every = log_every
+
+		self._validate_params()
+
+		self.optimizer = optimizer or torch.optim.Adam(
+			[param for param in self.model.parameters() if param.requires_grad], lr=self.lr
+		)
+		self.stats = TrainingStats()
+		self.history = list()
+		self.logger = logging.getLogger(__name__)
+
+		if self.num_threads is not None:
+			torch.set_num_threads(self.num_threads)
+
+	def _validate_params(self):
+		if not isinstance(self.model, NBeatsModelBase):
+			raise TypeError(f"model must be an NBeatsModelBase, got {type(self.model).__name__}.")
+
+		for name in ["batch_size", "eval_batch_size", "grad_accum_steps", "prefetch_factor"]:
+			val = getattr(self, name)
+			if not isinstance(val, int) or val <= 0:
+				raise ValueError(f"{name} must be a positive integer, got {val!r}.")
+
+		for name in ["num_threads", "patience"]:
+			val = getattr(self, name)
+			if val is not None and (not isinstance(val, int) or val <= 0):
+				raise ValueError(f"{name} must be a positive integer or None, got {val!r}.")
+
+		for name in ["num_workers", "log_every"]:
+			val = getattr(self, name)
+			if not isinstance(val, int) or val < 0:
+				raise ValueError(f"{name} must be a non-negative integer, got {val!r}.")
+
+		if not isinstance(self.bf16, bool):
+			raise ValueError(f"bf16 must be a boolean (True or False), got {type(self.bf16).__name__}.")
+
+	@property
+	def device(self):
+		return next(self.model.parameters()).device
+
+	def _autocast(self):
+		return torch.autocast(device_type=self.device.type, dtype=torch.bfloat16, enabled=self.bf16)
+
+	def _build_loader(self, dataset):
+		# The sampler yields whole index batches so the dataset serves each batch with one
+		# gather (SlidingWindowDataset / MultiSeriesWindowDataset index-array path).
+		loader_kwargs = dict()
+		if self.num_workers > 0:
+			loader_kwargs.update(prefetch_factor=self.prefetch_factor, persistent_workers=True)
+		return DataLoader(
+			dataset,
+			sampler=BatchSampler(RandomSampler(dataset), batch_size=self.batch_size, drop_last=False),
+			batch_size=None,
+			num_workers=self.num_workers,
+			**loader_kwargs
+		)
+
+	def _compute_loss(self, X, y):
+		with self._autocast():
+			forecast = self.model(X)
+		return self.loss_fn(forecast.float(), y)
+
+	def train_epoch(self, loader):
+		self.model.train()
+		self.stats.reset()
+		total_loss = 0.0
+		n_batches = 0
+
+		self.optimizer.zero_grad(set_to_none=True)
+		iterator = iter(loader)
+		step = 0
+		while True:
+			wait_start = time.perf_counter()
+			try:
+				X, y = next(iterator)
+			except StopIteration:
+				break
+			compute_start = time.perf_counter()
+
+			X, y = X.to(self.device), y.to(self.device)
+			loss = self._compute_loss(X, y)
+			(loss / self.grad_accum_steps).backward()
+
+			step += 1
+			if step % self.grad_accum_steps == 0:
+				self._optimizer_step()
+
+			compute_end = time.perf_counter()
+			self.stats.update(len(X), compute_start - wait_start, compute_end - compute_start)
+			total_loss += loss.item()
+			n_batches += 1
+
+			if self.log_every and n_batches % self.log_every == 0:
+				self._log_stats(f"step {n_batches}", total_loss / n_batches)
+
+		remainder = step % self.grad_accum_steps
+		if remainder:
+			# The last window is short: its micro-batches were divided by grad_accum_steps, so
+			# rescale to the mean over the micro-batches it actually has.
+			with torch.no_grad():
+				for param in self.model.parameters():
+					if param.grad is not None:
+						param.grad.mul_(self.grad_accum_steps / remainder)
+			self._optimizer_step()
+
+		return total_loss / max(n_batches, 1)
+
+	def _optimizer_step(self):
+		if self.max_grad_norm is not None:
+			torch.nn.utils.clip_grad_norm_(self.model.parameters(), self.max_grad_norm)
+		self.optimizer.step()
+		self.optimizer.zero_grad(set_to_none=True)
+
+	def evaluate(self, dataset):
+		# Batched no-grad pass; windows are gathered in eval_batch_size chunks.
+		self.model.eval()
+		total_loss = 0.0
+		n_samples = 0
+		with torch.inference_mode():
+			for start in range(0, len(dataset), self.eval_batch_size):
+				X, y = dataset[start : start + self.eval_batch_size]
+				X, y = X.to(self.device), y.to(self.device)
+				loss = self._compute_loss(X, y)
+				total_loss += loss.item() * len(X)
+				n_samples += len(X)
+		return total_loss / max(n_samples, 1)
+
+	def fit(self, train_dataset, n_epochs=1, val_dataset=None):
+		loader = self._build_loader(train_dataset)
+
+		best_loss = math.inf
+		best_state = None
+		epochs_without_improvement = 0
+
+		for epoch in range(n_epochs):
+			train_loss = self.train_epoch(loader)
+			record = dict(epoch=epoch, train_loss=train_loss, **self.stats.summary())
+
+			if val_dataset is not None:
+				val_loss = self.evaluate(val_dataset)
+				record["val_loss"] = val_loss
+				if val_loss < best_loss:
+					best_loss = val_loss
+					best_state = copy.deepcopy(self.model.state_dict())
+					epochs_without_improvement = 0
+				else:
+					epochs_without_improvement += 1
+
+			self.history.append(record)
+			if self.log_every:
+				self._log_stats(f"epoch {epoch}", train_loss, record.get("val_loss"))
+
+			if self.patience is not None and epochs_without_improvement >= self.patience:
+				self.logger.info(f"Early stopping after epoch {epoch} (best val_loss={best_loss:.6f}).")
+				break
+
+		if best_state is not None:
+			self.model.load_state_dict(best_state)
+		return self.history
+
+	def _log_stats(self, prefix, train_loss, val_loss=None):
+		summary = self.stats.summary()
+		message = (
+			f"{prefix}: loss={train_loss:.6f} "
+			f"samples/sec={summary['samples_per_sec']:.0f} "
+			f"step={summary['step_latency_ms']:.2f}ms "
+			f"data_wait={summary['data_wait_ms']:.2f}ms ({100 * summary['data_wait_fraction']:.1f}%)"
+		)
+		if val_loss is not None:
+			message += f" val_loss={val_loss:.6f}"
+		self.logger.info(message)
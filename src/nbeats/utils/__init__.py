@@ -1,5 +1,25 @@
-from .sliding_window_dataset import SlidingWindowDataset
+from .sliding_window_dataset import SlidingWindowDataset, collate_batch
+from .multi_series_dataset import MultiSeriesWindowDataset
+from .intermediate_capture import IntermediateCapture
+from .quantization import quantization_report
+from .export import ForecastGraph, export_model, load_exported
+from .profiling import ModelProfiler
+from .checkpoint import save_checkpoint, load_checkpoint, load_checkpoint_config
+from .pruning import block_contributions, prune_model
 
 __all__ = [
-	"SlidingWindowDataset"
+	"SlidingWindowDataset",
+	"collate_batch",
+	"MultiSeriesWindowDataset",
+	"IntermediateCapture",
+	"quantization_report",
+	"ForecastGraph",
+	"export_model",
+	"load_exported",
+	"ModelProfiler",
+	"save_checkpoint",
+	"load_checkpoint",
+	"load_checkpoint_config",
+	"block_contributions",
+	"prune_model"
 ]
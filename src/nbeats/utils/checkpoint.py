@@ -0,0 +1,110 @@
+import json
+import os
+
+import torch
+
+CHECKPOINT_VERSION = 1
+CONFIG_FILE = "config.json"
+WEIGHTS_FILE = "weights.pt"
+
+def _model_classes():
+	from ..models import NBeatsGeneric, NBeatsInterpretable
+	return {cls.__name__: cls for cls in (NBeatsGeneric, NBeatsInterpretable)}
+
+def save_checkpoint(model, path):
+	# A checkpoint is a directory with the constructor config (JSON) next to a flat
+	# tensor file. Ensembles store each weight once with a leading member dimension.
+	from ..models import NBeatsEnsemble
+
+	if isinstance(model, NBeatsEnsemble):
+		member = model._member_template
+		params, buffers = model._stacked_state()
+		persistent = member.state_dict().keys()
+		state = {
+			name: tensor.detach().cpu().contiguous()
+			for name, tensor in {**params, **buffers}.items() if name in persistent
+		}
+		n_members = model.n_members
+	else:
+		member = model
+		state = {name: tensor.detach().cpu().contiguous() for name, tensor in model.state_dict().items()}
+		n_members = None
+
+	config = {
+		"version": CHECKPOINT_VERSION,
+		"model_class": type(member).__name__,
+		"config": member.get_config(),
+		"n_members": n_members,
+		"n_stacks": len(member.stacks),
+	}
+
+	os.makedirs(path, exist_ok=True)
+	torch.save(state, os.path.join(path, WEIGHTS_FILE))
+	with open(os.path.join(path, CONFIG_FILE), "w") as fp:
+		json.dump(config, fp, indent=2)
+	return path
+
+def load_checkpoint_config(path):
+	with open(os.path.join(path, CONFIG_FILE), "r") as fp:
+		config = json.load(fp)
+	if config.get("version") != CHECKPOINT_VERSION:
+		raise ValueError(f"Unsupported checkpoint version {config.get('version')!r} in {path}.")
+	return config
+
+def _build_model(config):
+	model_classes = _model_classes()
+	if config["model_class"] not in model_classes:
+		raise ValueError(f"Unknown model class {config['model_class']!r}; expected one of {sorted(model_classes)}.")
+	# Parameters are replaced by the checkpoint tensors, so skip allocation/initialization.
+	with torch.device("meta"):
+		return model_classes[config["model_class"]](**config["config"])
+
+def _assign(module, state):
+	module.load_state_dict(state, assign=True)
+	# Non-persistent buffers (cached bases) are re-attached on the weights' device.
+	return module.to(next(iter(state.values())).device) if state else module
+
+def _assign_ensemble(config, state):
+	# The ensemble skeleton is built once on meta, and the stacked (n_members, ...) tensors
+	# are assigned as its member_params/buffers directly; no per-member copies or re-stacking.
+	from ..models import NBeatsEnsemble
+
+	member = _build_model(config)
+	ensemble = NBeatsEnsemble([member] * config["n_members"])
+	persistent = member.state_dict().keys()
+	ensemble_state = {f"member_params.{ii}": state[name] for ii, name in enumerate(ensemble._param_names)}
+	ensemble_state.update({
+		f"member_buffer_{ii}": state[name]
+		for ii, name in enumerate(ensemble._buffer_names) if name in persistent
+	})
+	return _assign(ensemble, ensemble_state)
+
+def load_checkpoint(path, stack=None, member=None, mmap=True, map_location="cpu"):
+	# Rebuilds the model from its config and maps the weight file without copying
+	# (mmap=True). stack selects a single NBeatsStack; member selects one ensemble member.
+	config = load_checkpoint_config(path)
+	state = torch.load(
+		os.path.join(path, WEIGHTS_FILE), map_location=map_location, mmap=mmap, weights_only=True
+	)
+
+	n_members = config.get("n_members")
+	if n_members is not None and member is None and stack is None:
+		return _assign_ensemble(config, state)
+
+	if n_members is not None:
+		member = 0 if member is None else member
+		if not 0 <= member < n_members:
+			raise IndexError(f"member must be in [0, {n_members}), got {member}.")
+		state = {name: tensor[member] for name, tensor in state.items()}
+	elif member is not None:
+		raise ValueError(f"{path} is not an ensemble checkpoint; member must be None.")
+
+	model = _build_model(config)
+	if stack is None:
+		return _assign(model, state)
+
+	if not 0 <= stack < config["n_stacks"]:
+		raise IndexError(f"stack must be in [0, {config['n_stacks']}), got {stack}.")
+	prefix = f"stacks.{stack}."
+	stack_state = {name[len(prefix):]: tensor for name, tensor in state.items() if name.startswith(prefix)}
+	return _assign(model.stacks[stack], stack_state)
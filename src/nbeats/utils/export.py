@@ -0,0 +1,97 @@
+import copy
+import os
+
+import numpy as np
+import torch
+import torch.nn
+
+EXPORT_FORMATS = ("torchscript", "export", "onnx")
+
+class ForecastGraph(torch.nn.Module):
+	# Forecast-only view of an NBeatsModelBase without the return_intermediates/capture
+	# branches, so tracing and export see a single static doubly-residual chain.
+	def __init__(self, model):
+		super().__init__()
+		self.blocks = torch.nn.ModuleList([
+			block for stack in model.stacks for block in stack.blocks
+		])
+
+	def forward(self, X):
+		residual = X
+		forecast_sum = None
+		for block in self.blocks:
+			backcast, forecast = block(residual)
+			residual = residual - backcast
+			forecast_sum = forecast if forecast_sum is None else forecast_sum + forecast
+		return forecast_sum
+
+
+def _infer_format(path):
+	extension = os.path.splitext(path)[1].lower()
+	if extension == ".onnx":
+		return "onnx"
+	elif extension == ".pt2":
+		return "export"
+	else:
+		return "torchscript"
+
+def export_model(model, path, format=None, fuse=True, example_batch_size=2):
+	format = format or _infer_format(path)
+	if format not in EXPORT_FORMATS:
+		raise ValueError(f"format must be one of {EXPORT_FORMATS}, got {format!r}.")
+
+	model = model.fuse_for_inference() if fuse else copy.deepcopy(model)
+	graph = ForecastGraph(model).cpu().eval()
+	graph.requires_grad_(False)
+	backcast = graph.blocks[0].backcast
+	example = torch.randn(example_batch_size, backcast)
+
+	os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+	if format == "torchscript":
+		with torch.no_grad():
+			traced = torch.jit.freeze(torch.jit.trace(graph, example))
+		traced.save(path)
+	elif format == "export":
+		batch = torch.export.Dim("batch")
+		program = torch.export.export(graph, (example,), dynamic_shapes={"X": {0: batch}})
+		torch.export.save(program, path)
+	else:
+		try:
+			import onnx  # noqa: F401
+		except ImportError:
+			raise ImportError("onnx is required for ONNX export but is not installed.")
+		batch = torch.export.Dim("batch")
+		torch.onnx.export(
+			graph, (example,), path, input_names=["X"], output_names=["forecast"],
+			dynamic_shapes={"X": {0: batch}}, dynamo=True
+		)
+	return path
+
+
+class _OnnxForecaster:
+	def __init__(self, path):
+		try:
+			import onnxruntime
+		except ImportError:
+			raise ImportError("onnxruntime is required to load ONNX models but is not installed.")
+		self.session = onnxruntime.InferenceSession(path, providers=["CPUExecutionProvider"])
+		self.input_name = self.session.get_inputs()[0].name
+
+	def __call__(self, X):
+		is_tensor = isinstance(X, torch.Tensor)
+		X = X.detach().cpu().numpy() if is_tensor else X
+		forecast = self.session.run(None, {self.input_name: np.asarray(X, dtype=np.float32)})[0]
+		return torch.from_numpy(forecast) if is_tensor else forecast
+
+
+def load_exported(path, format=None):
+	# Returns a callable X -> forecast; the N-BEATS classes are not needed to run it.
+	format = format or _infer_format(path)
+	if format == "torchscript":
+		return torch.jit.load(path, map_location="cpu")
+	elif format == "export":
+		return torch.export.load(path).module()
+	elif format == "onnx":
+		return _OnnxForecaster(path)
+	else:
+		raise ValueError(f"format must be one of {EXPORT_FORMATS}, got {format!r}.")
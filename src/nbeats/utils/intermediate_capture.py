@@ -0,0 +1,58 @@
+import numpy as np
+import torch
+
+class IntermediateCapture:
+	KINDS = ("backcast", "forecast", "residual")
+
+	def __init__(self, n_stacks, n_blocks, keep=KINDS):
+		self.n_stacks = n_stacks
+		self.n_blocks = n_blocks
+		self.keep = tuple(keep)
+
+		self._validate_params()
+
+		# Buffers of shape (stack, block, batch, length), allocated on first use on the
+		# device/dtype of the recorded tensors and reused while the batch shape matches.
+		self.backcast = None
+		self.forecast = None
+		self.residual = None
+
+	def _validate_params(self):
+		for name in ["n_stacks", "n_blocks"]:
+			val = getattr(self, name)
+			if not isinstance(val, int) or val <= 0:
+				raise ValueError(f"{name} must be a positive integer, got {val!r}.")
+
+		for kind in self.keep:
+			if kind not in self.KINDS:
+				raise ValueError(f"keep entries must be in {self.KINDS}, got {kind!r}.")
+
+	def _buffer(self, kind, tensor):
+		buffer = getattr(self, kind)
+		shape = (self.n_stacks, self.n_blocks) + tuple(tensor.shape)
+		if (
+			buffer is None or buffer.shape != shape or
+			buffer.device != tensor.device or buffer.dtype != tensor.dtype
+		):
+			buffer = torch.zeros(shape, device=tensor.device, dtype=tensor.dtype)
+			setattr(self, kind, buffer)
+		return buffer
+
+	def record(self, stack_idx, block_idx, backcast, forecast, residual):
+		with torch.no_grad():
+			for kind, tensor in zip(self.KINDS, (backcast, forecast, residual)):
+				if kind in self.keep:
+					self._buffer(kind, tensor)[stack_idx, block_idx].copy_(tensor)
+
+	def to_numpy(self, batch_first=True):
+		# A single device -> host copy per kept kind; the arrays never alias the reused buffers,
+		# so they stay valid across later forward passes.
+		result = dict()
+		for kind in self.keep:
+			buffer = getattr(self, kind)
+			if buffer is None:
+				result[kind] = None
+				continue
+			array = buffer.detach().to("cpu", copy=True).numpy()
+			result[kind] = np.moveaxis(array, 2, 0) if batch_first else array
+		return result
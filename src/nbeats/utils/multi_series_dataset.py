@@ -0,0 +1,144 @@
+import warnings
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset
+
+class MultiSeriesWindowDataset(Dataset):
+	def __init__(
+		self,
+		series,
+		backcast=10,
+		forecast=5,
+		include_backcast_in_y=False,
+		to_tensor=True,
+	):
+		super().__init__()
+		self._init_params(backcast, forecast, include_backcast_in_y, to_tensor)
+
+		series = [np.asarray(ss).reshape(-1) for ss in series]
+		lengths = np.fromiter((len(ss) for ss in series), dtype=np.int64, count=len(series))
+		values = np.concatenate(series) if series else np.empty(0)
+		self._set_buffer(values, lengths)
+
+	@classmethod
+	def from_flat(cls, values, offsets, **kwargs):
+		# offsets has n_series + 1 entries; series ii is values[offsets[ii]:offsets[ii + 1]].
+		offsets = np.asarray(offsets, dtype=np.int64)
+		if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or np.any(np.diff(offsets) < 0):
+			raise ValueError("offsets must be a non-decreasing one-dimensional array starting at 0.")
+		if offsets[-1] != len(values):
+			raise ValueError(f"offsets[-1] ({offsets[-1]}) must equal len(values) ({len(values)}).")
+
+		# The flat buffer is used as-is (no split/concatenate), so memory-mapped shards stay
+		# mapped; with to_tensor=True it is only converted when it is not already float32.
+		dataset = cls.__new__(cls)
+		Dataset.__init__(dataset)
+		dataset._init_params(**kwargs)
+		dataset._set_buffer(np.asarray(values), np.diff(offsets))
+		return dataset
+
+	@classmethod
+	def from_dataframe(cls, df, **kwargs):
+		# One series per column; trailing/leading NaN padding (as in the Tourism files) is dropped.
+		series = [df[column].dropna().to_numpy() for column in df.columns]
+		return cls(series, **kwargs)
+
+	def _init_params(self, backcast=10, forecast=5, include_backcast_in_y=False, to_tensor=True):
+		self.backcast = backcast
+		self.forecast = forecast
+		self.include_backcast_in_y = include_backcast_in_y
+		self.to_tensor = to_tensor
+
+		self._validate_params()
+
+	def _validate_params(self):
+		for name in ["backcast", "forecast"]:
+			val = getattr(self, name)
+			if not isinstance(val, int) or val <= 0:
+				raise ValueError(f"{name} must be a positive integer, got {val!r}.")
+
+		for name in ["include_backcast_in_y", "to_tensor"]:
+			val = getattr(self, name)
+			if not isinstance(val, bool):
+				raise ValueError(f"{name} must be a boolean (True or False), got {type(val).__name__}.")
+
+	def _set_buffer(self, values, lengths):
+		window = self.backcast + self.forecast
+
+		self.lengths = lengths
+		self.offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+		np.cumsum(lengths, out=self.offsets[1:])
+
+		# Series shorter than backcast + forecast contribute no windows.
+		n_windows = np.maximum(lengths - window + 1, 0)
+		self.window_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+		np.cumsum(n_windows, out=self.window_offsets[1:])
+
+		# Global window index: flat start position of every window in the values buffer.
+		series_ids = np.repeat(np.arange(len(lengths), dtype=np.int64), n_windows)
+		local_starts = np.arange(self.window_offsets[-1], dtype=np.int64) - self.window_offsets[series_ids]
+		self.window_starts = self.offsets[series_ids] + local_starts
+
+		self._window_steps = np.arange(window, dtype=np.int64)
+		self._start_y = 0 if self.include_backcast_in_y else self.backcast
+
+		if self.to_tensor:
+			values = values.astype(np.float32, copy=False)
+			with warnings.catch_warnings():
+				# Read-only (e.g. memory-mapped) buffers are shared as-is; windows are only read.
+				warnings.filterwarnings("ignore", message="The given NumPy array is not writable")
+				self.values = torch.from_numpy(values)
+			self.window_starts = torch.from_numpy(self.window_starts)
+			self._window_steps = torch.from_numpy(self._window_steps)
+		else:
+			self.values = values
+
+	@property
+	def n_series(self):
+		return len(self.lengths)
+
+	def get_series(self, series_idx):
+		return self.values[self.offsets[series_idx] : self.offsets[series_idx + 1]]
+
+	def get_series_index(self, idx):
+		idx = self._normalize_indices(idx)
+		return np.searchsorted(self.window_offsets, idx, side="right") - 1
+
+	def __len__(self):
+		return int(self.window_offsets[-1])
+
+	def __getitem__(self, idx):
+		if isinstance(idx, slice):
+			return self._getbatch(np.arange(*idx.indices(len(self))))
+		elif isinstance(idx, (int, np.integer)) or (isinstance(idx, torch.Tensor) and idx.ndim == 0):
+			xx, yy = self._getbatch(np.asarray([int(idx)]))
+			return xx[0], yy[0]
+		else:
+			return self._getbatch(idx)
+
+	def __getitems__(self, indices):
+		# Batched (X, y) as in SlidingWindowDataset; use with collate_fn=collate_batch.
+		return self._getbatch(indices)
+
+	def _normalize_indices(self, indices):
+		if isinstance(indices, torch.Tensor):
+			indices = indices.cpu().numpy()
+		indices = np.asarray(indices, dtype=np.int64)
+		if indices.ndim > 1:
+			raise IndexError(f"indices must be one-dimensional, got shape {indices.shape}.")
+
+		n = len(self)
+		indices = np.where(indices < 0, indices + n, indices)
+		if np.any((indices < 0) | (indices >= n)):
+			raise IndexError("index out of range")
+		return indices
+
+	def _getbatch(self, indices):
+		indices = self._normalize_indices(indices)
+		if self.to_tensor:
+			indices = torch.from_numpy(indices)
+
+		starts = self.window_starts[indices]
+		windows = self.values[starts[:, None] + self._window_steps]
+		return windows[:, :self.backcast], windows[:, self._start_y:]
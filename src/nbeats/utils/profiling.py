@@ -0,0 +1,159 @@
+import json
+import os
+import time
+
+import torch
+
+class ModelProfiler:
+	# Opt-in: hooks are only registered inside the context manager, so a model that is
+	# not being profiled runs its plain forward with no extra work.
+	def __init__(self, model, record_functions=True):
+		self.model = model
+		self.record_functions = record_functions
+		self.events = list()
+		self._handles = list()
+		self._open = list()
+		self._stack_idx = None
+		self._block_idx = 0
+
+	def __enter__(self):
+		self.events = list()
+		self._handles.append(self.model.register_forward_pre_hook(self._model_pre_hook))
+		self._handles.append(self.model.register_forward_hook(self._model_post_hook))
+
+		seen = set()
+		for stack_idx, stack in enumerate(self.model.stacks):
+			self._handles.append(stack.register_forward_pre_hook(self._stack_pre_hook(stack_idx)))
+			self._handles.append(stack.register_forward_hook(self._stack_post_hook))
+			for block in stack.blocks:
+				if id(block) in seen:
+					continue
+				seen.add(id(block))
+				self._handles.append(block.register_forward_pre_hook(self._block_pre_hook))
+				self._handles.append(block.register_forward_hook(self._block_post_hook))
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		for handle in self._handles:
+			handle.remove()
+		self._handles = list()
+		while self._open:
+			self._close()
+
+	# --- Hooks ---
+	def _begin(self, name, kind, X, **fields):
+		record_function = None
+		if self.record_functions:
+			record_function = torch.profiler.record_function(name)
+			record_function.__enter__()
+		event = dict(
+			name=name, kind=kind, batch_size=X.shape[0], element_size=X.element_size(), **fields
+		)
+		self._open.append((event, record_function, time.perf_counter()))
+		return event
+
+	def _close(self):
+		event, record_function, start = self._open.pop()
+		event["start"] = start
+		event["end"] = time.perf_counter()
+		if record_function is not None:
+			record_function.__exit__(None, None, None)
+		self.events.append(event)
+		return event
+
+	def _model_pre_hook(self, module, args):
+		self._begin(type(module).__name__, "model", args[0])
+
+	def _model_post_hook(self, module, args, output):
+		self._close()
+
+	def _stack_pre_hook(self, stack_idx):
+		def hook(module, args):
+			self._stack_idx = stack_idx
+			self._block_idx = 0
+			self._begin(f"stack_{stack_idx}:{type(module).__name__}", "stack", args[0], stack=stack_idx)
+		return hook
+
+	def _stack_post_hook(self, module, args, output):
+		self._close()
+
+	def _block_pre_hook(self, module, args):
+		X = args[0]
+		name = f"stack_{self._stack_idx}/block_{self._block_idx}:{type(module).__name__}"
+		event = self._begin(name, "block", X, stack=self._stack_idx, block=self._block_idx)
+		event.update(module.estimate_cost(X.shape[0], X.element_size()))
+
+	def _block_post_hook(self, module, args, output):
+		self._close()
+		self._block_idx += 1
+
+	# --- Reports ---
+	def summary(self):
+		rows = dict()
+		for event in self.events:
+			if event["kind"] == "model":
+				continue
+			key = (event["stack"], event.get("block", -1))
+			row = rows.setdefault(key, dict(
+				name=event["name"], kind=event["kind"], stack=event["stack"], block=event.get("block"),
+				calls=0, total_ms=0.0, flops=0, activation_bytes=0
+			))
+			row["calls"] += 1
+			row["total_ms"] += 1000 * (event["end"] - event["start"])
+			if event["kind"] == "block":
+				row["flops"] += event["flops_fc_stack"] + event["flops_theta"] + event["flops_basis"]
+				row["activation_bytes"] += event["activation_bytes"]
+
+		# Stack rows aggregate their blocks' FLOPs and activations.
+		for (stack_idx, block_idx), row in rows.items():
+			if block_idx == -1:
+				blocks = [r for (ss, bb), r in rows.items() if ss == stack_idx and bb != -1]
+				row["flops"] = sum(r["flops"] for r in blocks)
+				row["activation_bytes"] = sum(r["activation_bytes"] for r in blocks)
+
+		total_ms = sum(1000 * (e["end"] - e["start"]) for e in self.events if e["kind"] == "model")
+		result = sorted(rows.values(), key=lambda r: (r["stack"], -1 if r["block"] is None else r["block"]))
+		for row in result:
+			row["mean_ms"] = row["total_ms"] / row["calls"]
+			row["pct_time"] = 100 * row["total_ms"] / total_ms if total_ms else 0.0
+			row["gflops_per_sec"] = row["flops"] / (row["total_ms"] * 1e6) if row["total_ms"] else 0.0
+		return result
+
+	def summary_table(self):
+		header = f"{'name':<44} {'calls':>6} {'total ms':>10} {'mean ms':>9} {'% time':>7} {'MFLOPs':>10} {'GFLOP/s':>8} {'act MB':>8}"
+		lines = [header, "-" * len(header)]
+		for row in self.summary():
+			name = row["name"] if row["kind"] == "stack" else "  " + row["name"]
+			lines.append(
+				f"{name:<44} {row['calls']:>6} {row['total_ms']:>10.3f} {row['mean_ms']:>9.3f} "
+				f"{row['pct_time']:>7.1f} {row['flops'] / 1e6:>10.2f} {row['gflops_per_sec']:>8.2f} "
+				f"{row['activation_bytes'] / 1024**2:>8.2f}"
+			)
+		return "\n".join(lines)
+
+	def chrome_trace(self):
+		if not self.events:
+			return {"traceEvents": []}
+		origin = min(event["start"] for event in self.events)
+		skip = {"name", "start", "end"}
+		return {
+			"traceEvents": [
+				{
+					"name": event["name"],
+					"cat": event["kind"],
+					"ph": "X",
+					"ts": 1e6 * (event["start"] - origin),
+					"dur": 1e6 * (event["end"] - event["start"]),
+					"pid": os.getpid(),
+					"tid": 0,
+					"args": {key: value for key, value in event.items() if key not in skip},
+				}
+				for event in sorted(self.events, key=lambda e: e["start"])
+			]
+		}
+
+	def export_chrome_trace(self, path):
+		os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+		with open(path, "w") as fp:
+			json.dump(self.chrome_trace(), fp)
+		return path
@@ -0,0 +1,164 @@
+import numpy as np
+import torch
+
+def _batches(X, batch_size):
+	X = torch.as_tensor(X, dtype=torch.float32)
+	for start in range(0, len(X), batch_size):
+		yield X[start : start + batch_size]
+
+def _forward_skipping(model, X, skip):
+	# Full doubly-residual pass with the (stack_idx, block_idx) blocks in `skip` bypassed.
+	residual = X
+	forecast_sum = 0
+	for stack_idx, stack in enumerate(model.stacks):
+		for block_idx, block in enumerate(stack.blocks):
+			if (stack_idx, block_idx) in skip:
+				continue
+			backcast, forecast = block(residual)
+			residual = residual - backcast
+			forecast_sum = forecast_sum + forecast
+	return forecast_sum
+
+def block_contributions(model, X, method="contribution", batch_size=4096):
+	# Returns {"blocks": (n_stacks, n_blocks), "stacks": (n_stacks,)} impact scores over the
+	# calibration windows X, relative to the norm of the final forecast:
+	#   "contribution": mean ||block forecast|| / ||forecast||, from the return_intermediates
+	#     decomposition (one forward pass);
+	#   "ablation": mean ||forecast - forecast without it|| / ||forecast||, which also counts the
+	#     block's effect on downstream residuals (one pass per block and per stack).
+	if method not in ("contribution", "ablation"):
+		raise ValueError(f"method must be 'contribution' or 'ablation', got {method!r}.")
+
+	n_stacks = len(model.stacks)
+	n_blocks = max(len(stack.blocks) for stack in model.stacks)
+	block_scores = torch.zeros((n_stacks, n_blocks), dtype=torch.float64)
+	stack_scores = torch.zeros(n_stacks, dtype=torch.float64)
+	n_samples = 0
+
+	model.eval()
+	with torch.inference_mode():
+		for X_batch in _batches(X, batch_size):
+			capture = model.build_capture(keep=("forecast",))
+			forecast = model(X_batch, capture=capture)
+			scale = forecast.norm(dim=-1).clamp(min=1e-12).double()
+
+			if method == "contribution":
+				forecasts = capture.forecast.double()
+				block_scores += (forecasts.norm(dim=-1) / scale).sum(-1)
+				stack_scores += (forecasts.sum(1).norm(dim=-1) / scale).sum(-1)
+			else:
+				for stack_idx, stack in enumerate(model.stacks):
+					for block_idx in range(len(stack.blocks)):
+						ablated = _forward_skipping(model, X_batch, {(stack_idx, block_idx)})
+						block_scores[stack_idx, block_idx] += ((forecast - ablated).norm(dim=-1) / scale).sum()
+					skip = {(stack_idx, block_idx) for block_idx in range(len(stack.blocks))}
+					ablated = _forward_skipping(model, X_batch, skip)
+					stack_scores[stack_idx] += ((forecast - ablated).norm(dim=-1) / scale).sum()
+			n_samples += len(X_batch)
+
+	return {"blocks": (block_scores / n_samples).numpy(), "stacks": (stack_scores / n_samples).numpy()}
+
+def _select(model, scores, block_threshold, stack_threshold, n_stacks, n_blocks):
+	# Constructor configs describe uniform stacks, so every kept stack keeps the same number
+	# of blocks: its n_blocks highest-impact ones, in their original order.
+	from ..models import NBeatsGeneric
+
+	stack_scores, block_scores = scores["stacks"], scores["blocks"]
+	stack_order = np.argsort(-stack_scores, kind="stable")
+	if not isinstance(model, NBeatsGeneric):
+		# Interpretable models always keep their trend and seasonality stacks.
+		kept_stacks = list(range(len(model.stacks)))
+	else:
+		if n_stacks is None:
+			n_stacks = max(1, int((stack_scores >= stack_threshold).sum()))
+		kept_stacks = sorted(stack_order[:n_stacks].tolist())
+
+	if n_blocks is None:
+		n_blocks = max(1, max(int((block_scores[stack_idx] >= block_threshold).sum()) for stack_idx in kept_stacks))
+
+	kept_blocks = dict()
+	for stack_idx in kept_stacks:
+		stack = model.stacks[stack_idx]
+		if stack.shared_weights:
+			# Every position runs the same block; keep the first n_blocks repetitions.
+			kept_blocks[stack_idx] = list(range(min(n_blocks, len(stack.blocks))))
+		else:
+			order = np.argsort(-block_scores[stack_idx][:len(stack.blocks)], kind="stable")
+			kept_blocks[stack_idx] = sorted(order[:n_blocks].tolist())
+	return kept_blocks
+
+def _build_pruned(model, kept_blocks):
+	from ..models import NBeatsGeneric
+
+	config = dict(model.get_config(), n_blocks=max(len(blocks) for blocks in kept_blocks.values()))
+	if isinstance(model, NBeatsGeneric):
+		config["n_stacks"] = len(kept_blocks)
+	pruned = type(model)(**config)
+
+	for new_stack, (stack_idx, blocks) in zip(pruned.stacks, kept_blocks.items()):
+		old_stack = model.stacks[stack_idx]
+		for new_block, block_idx in zip(new_stack.blocks, blocks):
+			new_block.load_state_dict(old_stack.blocks[block_idx].state_dict())
+	return pruned.to(next(model.parameters()).device)
+
+def prune_model(
+	model,
+	X,
+	y_true=None,
+	method="contribution",
+	block_threshold=0.05,
+	stack_threshold=0.05,
+	n_stacks=None,
+	n_blocks=None,
+	fine_tune_dataset=None,
+	fine_tune_epochs=1,
+	trainer_kwargs=None,
+	batch_size=4096,
+):
+	# Scores blocks/stacks on the calibration windows X and returns (pruned_model, report).
+	# Blocks and stacks whose impact is below the thresholds are dropped, unless n_blocks /
+	# n_stacks are given explicitly. Only NBeatsGeneric can drop stacks; passing n_stacks for
+	# another model raises ValueError. With fine_tune_dataset, the pruned model is trained for
+	# fine_tune_epochs with the regular Trainer to recover accuracy.
+	from ts_datasets.utils import metrics
+	from ..models import NBeatsGeneric
+
+	if n_stacks is not None and not isinstance(model, NBeatsGeneric):
+		raise ValueError(
+			f"n_stacks is only supported for NBeatsGeneric; {type(model).__name__} keeps all its "
+			f"stacks (prune blocks with n_blocks or block_threshold instead)."
+		)
+
+	scores = block_contributions(model, X, method=method, batch_size=batch_size)
+	kept_blocks = _select(model, scores, block_threshold, stack_threshold, n_stacks, n_blocks)
+	pruned = _build_pruned(model, kept_blocks)
+
+	def evaluate(candidate):
+		candidate.eval()
+		with torch.inference_mode():
+			return np.concatenate([candidate(X_batch).cpu().numpy() for X_batch in _batches(X, batch_size)])
+
+	report = {
+		"scores": scores,
+		"kept_blocks": kept_blocks,
+		"n_blocks_before": sum(len(stack.blocks) for stack in model.stacks),
+		"n_blocks_after": sum(len(stack.blocks) for stack in pruned.stacks),
+		"n_params_before": sum(param.numel() for param in model.parameters()),
+		"n_params_after": sum(param.numel() for param in pruned.parameters()),
+	}
+	forecast = evaluate(model)
+	report["smape_vs_original"] = float(metrics.smape(forecast, evaluate(pruned)))
+	if y_true is not None:
+		y_true = np.asarray(y_true, dtype=np.float32)
+		report["smape_original"] = float(metrics.smape(y_true, forecast))
+		report["smape_pruned"] = float(metrics.smape(y_true, evaluate(pruned)))
+
+	if fine_tune_dataset is not None:
+		from ..training import Trainer
+
+		Trainer(pruned, **(trainer_kwargs or {})).fit(fine_tune_dataset, n_epochs=fine_tune_epochs)
+		report["smape_vs_original_fine_tuned"] = float(metrics.smape(forecast, evaluate(pruned)))
+		if y_true is not None:
+			report["smape_fine_tuned"] = float(metrics.smape(y_true, evaluate(pruned)))
+
+	return pruned.eval(), report
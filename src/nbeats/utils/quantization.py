@@ -0,0 +1,44 @@
+import io
+import time
+
+import numpy as np
+import torch
+
+def _model_size_bytes(model):
+	buffer = io.BytesIO()
+	torch.save(model.state_dict(), buffer)
+	return buffer.getbuffer().nbytes
+
+def _latency_ms(model, X, n_repeats):
+	with torch.inference_mode():
+		model(X)
+		start = time.perf_counter()
+		for _ in range(n_repeats):
+			model(X)
+	return 1000 * (time.perf_counter() - start) / n_repeats
+
+def quantization_report(float_model, quantized_model, X, y_true=None, n_repeats=10):
+	from ts_datasets.utils import metrics
+
+	X = torch.as_tensor(X, dtype=torch.float32)
+	with torch.inference_mode():
+		y_float = float_model(X).numpy()
+		y_quantized = quantized_model(X).numpy()
+
+	report = {
+		"smape_float_vs_quantized": float(metrics.smape(y_float, y_quantized)),
+		"latency_ms_float": _latency_ms(float_model, X, n_repeats),
+		"latency_ms_quantized": _latency_ms(quantized_model, X, n_repeats),
+		"size_bytes_float": _model_size_bytes(float_model),
+		"size_bytes_quantized": _model_size_bytes(quantized_model),
+	}
+	report["speedup"] = report["latency_ms_float"] / report["latency_ms_quantized"]
+	report["size_ratio"] = report["size_bytes_quantized"] / report["size_bytes_float"]
+
+	if y_true is not None:
+		y_true = np.asarray(y_true, dtype=np.float32)
+		report["smape_float"] = float(metrics.smape(y_true, y_float))
+		report["smape_quantized"] = float(metrics.smape(y_true, y_quantized))
+		report["smape_delta"] = report["smape_quantized"] - report["smape_float"]
+
+	return report
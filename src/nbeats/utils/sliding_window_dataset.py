@@ -2,6 +2,11 @@ import numpy as np
 import torch
 from torch.utils.data import Dataset
 
+def collate_batch(batch):
+	# Pass-through collate_fn for the window datasets, whose __getitems__ already returns
+	# the stacked (X, y) batch.
+	return batch
+
 class SlidingWindowDataset(Dataset):
 	def __init__(
 		self,
@@ -39,6 +44,8 @@ class SlidingWindowDataset(Dataset):
 			self.XX = torch.from_numpy(self.XX.astype(np.float32))
 			self.yy = torch.from_numpy(self.yy.astype(np.float32))
 
+		self._build_windows()
+
 	def _validate_params(self):
 		for name in ["backcast", "forecast"]:
 			val = getattr(self, name)
@@ -65,11 +72,41 @@ class SlidingWindowDataset(Dataset):
 	def __len__(self):
 		return max(0, len(self.XX) - (self.backcast + self.forecast) + 1)
 
+	def _build_windows(self):
+		n = len(self)
+		self._xx_windows = SlidingWindowDataset._window_view(self.XX, 0, self.backcast, n)
+
+		start_y = 0 if self.include_backcast_in_y else self.backcast
+		length_y = self.forecast + (self.backcast if self.include_backcast_in_y else 0)
+		self._yy_windows = SlidingWindowDataset._window_view(self.yy, start_y, length_y, n)
+
+	@staticmethod
+	def _window_view(array, start, length, n):
+		# Strided (n, length[, n_features]) view over array[start:]; no data is copied.
+		array = array[start:]
+		if isinstance(array, torch.Tensor):
+			windows = array.unfold(0, length, 1).movedim(-1, 1)
+		else:
+			windows = np.lib.stride_tricks.sliding_window_view(array, length, axis=0)
+			windows = np.moveaxis(windows, -1, 1)
+		windows = windows[:n]
+		if windows.shape[-1] == 1:
+			windows = windows[..., 0]
+		return windows
+
 	def __getitem__(self, idx):
 		if isinstance(idx, slice):
 			return self._getslice(idx)
+		elif isinstance(idx, (int, np.integer)) or (isinstance(idx, torch.Tensor) and idx.ndim == 0):
+			return self._getitem(int(idx))
 		else:
-			return self._getitem(idx)
+			return self._getbatch(idx)
+
+	def __getitems__(self, indices):
+		# Called by DataLoader with automatic batching: the batch is gathered in one indexing
+		# operation and returned as (X, y), so use collate_fn=collate_batch (no re-stacking).
+		# The Trainer's loaders pass index batches with batch_size=None and need neither.
+		return self._getbatch(indices)
 
 	def _getitem(self, idx):
 		n = len(self)
@@ -77,33 +114,27 @@ class SlidingWindowDataset(Dataset):
 			idx += n
 		if idx < 0 or idx >= n:
 			raise IndexError("index out of range")
+		return self._xx_windows[idx], self._yy_windows[idx]
 
-		xx = self.XX[idx : idx + self.backcast]
-		if xx.ndim == 1:
-			xx = xx.reshape(-1, 1)
+	def _getslice(self, idx):
+		start, stop, step = idx.indices(len(self))
+		if step > 0:
+			return self._xx_windows[start:stop:step], self._yy_windows[start:stop:step]
+		# Tensors do not support negative strides, gather the reversed slice instead.
+		return self._getbatch(np.arange(start, stop, step))
 
-		start_y = idx if self.include_backcast_in_y else idx + self.backcast
-		end_y = idx + self.backcast + self.forecast
-		yy = self.yy[start_y:end_y]
-		if yy.ndim == 1:
-			yy = yy.reshape(-1, 1)
+	def _getbatch(self, indices):
+		if isinstance(indices, torch.Tensor):
+			indices = indices.cpu().numpy()
+		indices = np.asarray(indices, dtype=np.int64)
+		if indices.ndim != 1:
+			raise IndexError(f"indices must be one-dimensional, got shape {indices.shape}.")
 
-		return xx.squeeze(-1), yy.squeeze(-1)
+		n = len(self)
+		indices = np.where(indices < 0, indices + n, indices)
+		if np.any((indices < 0) | (indices >= n)):
+			raise IndexError("index out of range")
 
-	def _getslice(self, idx):
-		indices = range(*idx.indices(len(self)))
-		xx_list, yy_list = [], []
-		for ii in indices:
-			tmp_x, tmp_y = self._getitem(ii)
-			xx_list.append(tmp_x)
-			yy_list.append(tmp_y)
-		if not xx_list:
-			if self.to_tensor:
-				return torch.empty(0), torch.empty(0)
-			else:
-				return np.empty((0, 0), dtype=self.XX.dtype), np.empty((0, 0), dtype=self.yy.dtype)
 		if self.to_tensor:
-			return torch.stack(xx_list), torch.stack(yy_list)
-		else:
-			return np.stack(xx_list).squeeze(-1), np.stack(yy_list).squeeze(-1)
-
+			indices = torch.from_numpy(indices)
+		return self._xx_windows[indices], self._yy_windows[indices]
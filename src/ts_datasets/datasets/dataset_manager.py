@@ -4,12 +4,13 @@ import glob
 import logging
 import os
 import re
-import requests
 
 import pandas as pd
 
 from ..utils import path_utils
 from ..utils import dataframe_utils
+from ..utils import download_utils
+from ..utils.artifact_registry import ArtifactRegistry
 
 class DatasetManager(ABC):
 	def __init__(self, dataset_name, project_root=None):
@@ -23,6 +24,8 @@ class DatasetManager(ABC):
 		self.artifacts_dir = os.path.join(self.dataset_dir, "artifacts")
 		self.results_dir = os.path.join(self.dataset_dir, "results")
 		self.figures_dir = os.path.join(self.dataset_dir, "figures")
+
+		self.registry = ArtifactRegistry(self.artifacts_dir)
 		
 		self.logger = logging.getLogger(__name__)
 		self.logger.setLevel(logging.INFO)
@@ -144,7 +147,7 @@ class DatasetManager(ABC):
 		)
 		return path
 	
-	def save_model(self, model, base_filename):
+	def save_model(self, model, base_filename, metrics=None, tags=None, keep_last=None):
 		import torch
 		timestamp_str = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 		base_name, file_extension = os.path.splitext(base_filename)
@@ -153,8 +156,26 @@ class DatasetManager(ABC):
 		os.makedirs(os.path.dirname(path), exist_ok=True)
 		torch.save(model, path)
 		self.log(f"Saved model to artifacts directory: {path}")
+		self._register_model(base_filename, model, path, metrics, tags, keep_last)
 		return path
 
+	def save_model_checkpoint(self, model, base_name, metrics=None, tags=None, keep_last=None):
+		from nbeats.utils import save_checkpoint
+		timestamp_str = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+		path = self.get_artifacts_file_path(f"{base_name}_{timestamp_str}")
+		save_checkpoint(model, path)
+		self.log(f"Saved model checkpoint to artifacts directory: {path}")
+		self._register_model(base_name, model, path, metrics, tags, keep_last)
+		return path
+
+	def _register_model(self, name, model, path, metrics, tags, keep_last):
+		get_config = getattr(model, "get_config", None)
+		config = get_config() if callable(get_config) else None
+		self.registry.register(name, path, config=config, metrics=metrics, tags=tags)
+		if keep_last is not None:
+			for removed in self.registry.prune(name, keep_last=keep_last):
+				self.log(f"Pruned old artifact: {removed}")
+
 	def save_results_dataframe(self, df, filename, append=False, index=True, suppress_logs=False):
 		path = self.get_results_file_path(filename)
 		self._save_csv_dataframe(
@@ -184,12 +205,46 @@ class DatasetManager(ABC):
 			path, header=header, index_col=index_col, nrows=nrows, verbose=verbose
 		)
 	
-	def load_model(self, base_filename):
-		import torch
-		path = DatasetManager._get_latest_file(self.get_artifacts_dir(), base_filename)
+	def _resolve_artifact(self, base_filename, tag=None):
+		# Registered artifacts resolve through the manifest; the directory scan is only a
+		# fallback for artifacts saved before the registry existed.
+		path = self.registry.get_path(base_filename, tag=tag)
+		if path is None and tag is None:
+			path = DatasetManager._get_latest_file(self.get_artifacts_dir(), base_filename)
 		if path is None:
-			raise FileNotFoundError(f"No file found for '{base_filename}' in {self.get_artifacts_dir()}")
-		return torch.load(path, map_location="cpu")
+			label = base_filename if tag is None else f"{base_filename}@{tag}"
+			raise FileNotFoundError(f"No file found for '{label}' in {self.get_artifacts_dir()}")
+		return path
+
+	def load_model(self, base_filename, tag=None, use_cache=True, shared=False):
+		# Cache hits return a copy unless shared=True (see ArtifactRegistry.load).
+		import torch
+		path = self._resolve_artifact(base_filename, tag=tag)
+		loader = lambda path: torch.load(path, map_location="cpu", weights_only=False)
+		if use_cache:
+			return self.registry.load(path, loader, shared=shared)
+		return loader(path)
+
+	def load_model_checkpoint(
+		self, base_name, tag=None, stack=None, member=None, mmap=True, use_cache=True, shared=True
+	):
+		# Shared by default: every caller gets the same memory-mapped model, for read-only
+		# inference. Pass shared=False for a private instance to fine-tune (its cached copy
+		# lives in regular memory).
+		from nbeats.utils import load_checkpoint
+		path = self._resolve_artifact(base_name, tag=tag)
+		if not os.path.isdir(path):
+			raise FileNotFoundError(f"No checkpoint found for '{base_name}' in {self.get_artifacts_dir()}")
+		loader = lambda path: load_checkpoint(path, stack=stack, member=member, mmap=mmap)
+		if use_cache:
+			return self.registry.load(path, loader, key=(stack, member), shared=shared)
+		return loader(path)
+
+	def prune_artifacts(self, base_filename=None, keep_last=5, keep_tagged=True):
+		removed = self.registry.prune(base_filename, keep_last=keep_last, keep_tagged=keep_tagged)
+		for path in removed:
+			self.log(f"Pruned old artifact: {path}")
+		return removed
 
 	def load_results_dataframe(self, filename, header=None, index_col=0, nrows=None, verbose=True):
 		path = self.get_results_file_path(filename)
@@ -199,23 +254,12 @@ class DatasetManager(ABC):
 
 	# --- Download File ---
 	@staticmethod
-	def download_file(url, path):
-		headers = {
-			"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-						  "AppleWebKit/537.36 (KHTML, like Gecko) "
-						  "Chrome/120.0.0.0 Safari/537.36",
-			"Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-			"Referer": "https://robjhyndman.com/"
-		}
-
-		with requests.Session() as session:
-			response = session.get(url, headers=headers, stream=True)
-			response.raise_for_status()  # Will raise HTTPError if blocked
-
-			with open(path, "wb") as fp:
-				for chunk in response.iter_content(chunk_size=8192):
-					if chunk:
-						fp.write(chunk)
+	def download_file(url, path, sha256=None, manifest=None, force=False, n_parallel=4):
+		# Resumable (.part + HTTP Range), split into parallel ranges when the server
+		# supports it, retried with backoff and verified against sha256/the manifest.
+		headers = {"Referer": "https://robjhyndman.com/"}
+		with download_utils.Downloader(headers=headers, n_parallel=n_parallel) as downloader:
+			return downloader.download(url, path, sha256=sha256, manifest=manifest, force=force)
 
 	# --- Logger Helper ---
 	def log(self, message, level="info"):
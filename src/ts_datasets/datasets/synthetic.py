@@ -1,13 +1,17 @@
+import os
+
 import numpy as np
 import pandas as pd
 
 from .dataset_manager import DatasetManager
+from ..utils import synthetic_utils
 from ..utils import zip_utils
 
 class Synthetic(DatasetManager):
 	# --- Filenames ---
 	TRAINING_FILE = "training.csv"
 	TESTING_FILE = "testing.csv"
+	SHARDS_DIR = "shards"
 
 	def __init__(self, project_root=None):
 		super().__init__("Synthetic", project_root=project_root)
@@ -53,6 +57,26 @@ class Synthetic(DatasetManager):
 			self.self.TESTING_FILE, header=0, index_col=None, nrows=None, verbose=verbose
 		)
 
+	# --- Sharded Workloads ---
+	def get_shards_dir(self):
+		return os.path.join(self.get_raw_dir(), self.SHARDS_DIR)
+
+	def generate_shards(self, n_series, shard_size=20_000, seed=42, n_workers=4, **generator_kwargs):
+		output_dir = self.get_shards_dir()
+		self.log(f"Generating {n_series} synthetic series in shards of {shard_size}...")
+		manifest = synthetic_utils.write_shards(
+			output_dir, n_series, shard_size=shard_size, seed=seed, n_workers=n_workers, **generator_kwargs
+		)
+		self.log(f"Saved {len(manifest['shards'])} shards to: {output_dir}")
+		return manifest
+
+	def load_shard(self, shard_idx, mmap=True):
+		# (values, offsets), ready for MultiSeriesWindowDataset.from_flat.
+		return synthetic_utils.read_shard(self.get_shards_dir(), shard_idx, mmap=mmap)
+
+	def iter_shards(self, mmap=True):
+		return synthetic_utils.iter_shards(self.get_shards_dir(), mmap=mmap)
+
 	# --- Data Generation --- 
 	@staticmethod
 	def generate_data(n_periods=20, n_samples_per_period=10, n_harmonics=2, loc=0, scale=0.5, seed=42):
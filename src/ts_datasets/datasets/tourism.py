@@ -2,9 +2,9 @@
 # https://robjhyndman.com/publications/the-tourism-forecasting-competition/
 
 import os
-import requests
 
 from .dataset_manager import DatasetManager
+from ..utils import download_utils
 from ..utils import zip_utils
 
 class Tourism(DatasetManager):
@@ -18,6 +18,8 @@ class Tourism(DatasetManager):
 	MONTHLY_IN_FILE = "monthly_in.csv"
 	MONTHLY_OOS_FILE = "monthly_oos.csv"
 
+	DOWNLOAD_MANIFEST_FILE = "downloads.json"
+
 	YEARLY_FILE = "yearly.csv"
 	QUARTERLY_FILE = "quarterly.csv"
 	MONTHLY_FILE = "monthly.csv"
@@ -35,12 +37,13 @@ class Tourism(DatasetManager):
 		os.makedirs(dataset_dir, exist_ok=True)
 		os.makedirs(raw_dir, exist_ok=True)
 
-		if not os.path.exists(dataset_zip) or force:
+		manifest = download_utils.DownloadManifest(os.path.join(dataset_dir, self.DOWNLOAD_MANIFEST_FILE))
+		if not force and manifest.is_valid(dataset_zip):
+			print("Zip file already exists at:", dataset_zip)
+		else:
 			print("Downloading dataset...")
-			DatasetManager.download_file(dataset_url, dataset_zip)
+			DatasetManager.download_file(dataset_url, dataset_zip, manifest=manifest, force=force)
 			print("Dataset downloaded to:", dataset_zip)
-		else:
-			print("Zip file already exists at:", dataset_zip)
 
 		if unzip:
 			if os.path.exists(dataset_zip):
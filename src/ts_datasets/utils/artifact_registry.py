@@ -0,0 +1,205 @@
+import collections
+import contextlib
+import copy
+import datetime
+import hashlib
+import json
+import os
+import shutil
+
+try:
+	import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic.
+	fcntl = None
+
+def config_hash(config):
+	if config is None:
+		return None
+	payload = json.dumps(config, sort_keys=True, default=str).encode()
+	return hashlib.sha256(payload).hexdigest()[:16]
+
+def _path_size(path):
+	if os.path.isdir(path):
+		return sum(
+			os.path.getsize(os.path.join(root, filename))
+			for root, _, filenames in os.walk(path) for filename in filenames
+		)
+	return os.path.getsize(path)
+
+class ArtifactRegistry:
+	MANIFEST_FILE = "manifest.json"
+
+	def __init__(self, artifacts_dir, cache_size=4):
+		self.artifacts_dir = artifacts_dir
+		self.manifest_path = os.path.join(artifacts_dir, self.MANIFEST_FILE)
+		self.cache_size = cache_size
+
+		self._manifest = None
+		self._manifest_mtime = None
+		self._cache = collections.OrderedDict()
+
+	# --- Manifest I/O ---
+	def _read(self):
+		# One stat per lookup; the manifest is re-read only when another process changed it.
+		try:
+			mtime = os.stat(self.manifest_path).st_mtime_ns
+		except FileNotFoundError:
+			mtime = None
+		if self._manifest is None or mtime != self._manifest_mtime:
+			if mtime is None:
+				self._manifest = {"version": 1, "models": {}}
+			else:
+				with open(self.manifest_path, "r") as fp:
+					self._manifest = json.load(fp)
+			self._manifest_mtime = mtime
+		return self._manifest
+
+	def _write(self):
+		os.makedirs(self.artifacts_dir, exist_ok=True)
+		tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+		with open(tmp_path, "w") as fp:
+			json.dump(self._manifest, fp, indent=2)
+		os.replace(tmp_path, self.manifest_path)
+		self._manifest_mtime = os.stat(self.manifest_path).st_mtime_ns
+
+	@contextlib.contextmanager
+	def _locked(self):
+		# Exclusive lock on a sidecar file across read-modify-write, so registrations from
+		# concurrent processes are never dropped. The manifest is re-read under the lock.
+		os.makedirs(self.artifacts_dir, exist_ok=True)
+		with open(f"{self.manifest_path}.lock", "a") as lock_fp:
+			if fcntl is not None:
+				fcntl.flock(lock_fp, fcntl.LOCK_EX)
+			try:
+				self._manifest = None
+				yield self._read()
+			finally:
+				if fcntl is not None:
+					fcntl.flock(lock_fp, fcntl.LOCK_UN)
+
+	def _model(self, name, create=False):
+		models = self._read()["models"]
+		if name not in models and create:
+			models[name] = {"latest": None, "tags": {}, "entries": {}}
+		return models.get(name)
+
+	# --- Registration ---
+	def register(self, name, path, config=None, metrics=None, tags=None):
+		filename = os.path.basename(path)
+		entry = {
+			"filename": filename,
+			"timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+			"size_bytes": _path_size(path),
+			"config_hash": config_hash(config),
+			"config": config,
+			"metrics": metrics or {},
+		}
+		with self._locked():
+			model = self._model(name, create=True)
+			model["entries"][filename] = entry
+			model["latest"] = filename
+			for tag in tags or []:
+				model["tags"][tag] = filename
+			self._invalidate(path)
+			self._write()
+		return entry
+
+	def tag(self, name, filename, tag):
+		with self._locked():
+			model = self._model(name)
+			if model is None or filename not in model["entries"]:
+				raise KeyError(f"No artifact '{filename}' registered for '{name}'.")
+			model["tags"][tag] = filename
+			self._write()
+
+	def update_metrics(self, name, filename, metrics):
+		with self._locked():
+			model = self._model(name)
+			if model is None or filename not in model["entries"]:
+				raise KeyError(f"No artifact '{filename}' registered for '{name}'.")
+			model["entries"][filename]["metrics"].update(metrics)
+			self._write()
+
+	# --- Lookup ---
+	def names(self):
+		return sorted(self._read()["models"])
+
+	def entries(self, name):
+		model = self._model(name)
+		if model is None:
+			return []
+		return sorted(model["entries"].values(), key=lambda entry: entry["filename"])
+
+	def get(self, name, tag=None):
+		model = self._model(name)
+		if model is None:
+			return None
+		filename = model["latest"] if tag is None else model["tags"].get(tag)
+		return None if filename is None else model["entries"][filename]
+
+	def get_path(self, name, tag=None):
+		entry = self.get(name, tag=tag)
+		return None if entry is None else os.path.join(self.artifacts_dir, entry["filename"])
+
+	# --- In-process LRU cache of loaded artifacts ---
+	def load(self, path, loader, key=(), shared=False):
+		# shared=True returns the cached instance itself, with no copy at all (read-only use;
+		# memory-mapped checkpoints stay mapped). With shared=False every caller gets a private
+		# instance, so training or .train() on one result cannot leak into later hits: a miss
+		# returns the freshly loaded object as-is and caches a deep copy for later hits, which
+		# return deep copies of it.
+		cache_key = (path,) + tuple(key)
+		if cache_key in self._cache:
+			self._cache.move_to_end(cache_key)
+			value = self._cache[cache_key]
+			return value if shared else copy.deepcopy(value)
+
+		value = loader(path)
+		if self.cache_size > 0:
+			self._cache[cache_key] = value if shared else copy.deepcopy(value)
+			while len(self._cache) > self.cache_size:
+				self._cache.popitem(last=False)
+		return value
+
+	def _invalidate(self, path):
+		for cache_key in [key for key in self._cache if key[0] == path]:
+			del self._cache[cache_key]
+
+	def clear_cache(self):
+		self._cache.clear()
+
+	# --- Retention ---
+	def prune(self, name=None, keep_last=5, keep_tagged=True, dry_run=False):
+		with contextlib.nullcontext() if dry_run else self._locked():
+			return self._prune(name, keep_last, keep_tagged, dry_run)
+
+	def _prune(self, name, keep_last, keep_tagged, dry_run):
+		names = self.names() if name is None else [name]
+		removed = list()
+		for model_name in names:
+			model = self._model(model_name)
+			if model is None:
+				continue
+			protected = set(model["tags"].values()) if keep_tagged else set()
+			filenames = sorted(model["entries"])
+			candidates = filenames[:-keep_last] if keep_last > 0 else filenames
+			for filename in candidates:
+				if filename in protected:
+					continue
+				path = os.path.join(self.artifacts_dir, filename)
+				removed.append(path)
+				if dry_run:
+					continue
+				if os.path.isdir(path):
+					shutil.rmtree(path)
+				elif os.path.exists(path):
+					os.remove(path)
+				self._invalidate(path)
+				del model["entries"][filename]
+				model["tags"] = {tag: ff for tag, ff in model["tags"].items() if ff != filename}
+
+			remaining = sorted(model["entries"])
+			model["latest"] = remaining[-1] if remaining else None
+		if removed and not dry_run:
+			self._write()
+		return removed
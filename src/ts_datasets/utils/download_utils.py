@@ -0,0 +1,265 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+	"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+				  "AppleWebKit/537.36 (KHTML, like Gecko) "
+				  "Chrome/120.0.0.0 Safari/537.36",
+	"Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+MiB = 1024 * 1024
+
+def file_sha256(path, chunk_size=MiB):
+	digest = hashlib.sha256()
+	with open(path, "rb") as fp:
+		for chunk in iter(lambda: fp.read(chunk_size), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+class DownloadManifest:
+	# filename -> {"url", "sha256", "size"}; stored next to the downloaded files.
+	def __init__(self, path):
+		self.path = path
+		self.entries = dict()
+		if os.path.exists(path):
+			with open(path, "r") as fp:
+				self.entries = json.load(fp)
+
+	def get(self, filename):
+		return self.entries.get(filename)
+
+	def record(self, filename, url, sha256, size):
+		self.entries[filename] = {"url": url, "sha256": sha256, "size": size}
+		os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+		tmp_path = f"{self.path}.tmp"
+		with open(tmp_path, "w") as fp:
+			json.dump(self.entries, fp, indent=2)
+		os.replace(tmp_path, self.path)
+
+	def is_valid(self, path):
+		entry = self.get(os.path.basename(path))
+		if entry is None or not os.path.exists(path):
+			return False
+		if entry.get("size") is not None and os.path.getsize(path) != entry["size"]:
+			return False
+		return entry.get("sha256") is None or file_sha256(path) == entry["sha256"]
+
+
+class Downloader:
+	def __init__(
+		self,
+		headers=None,
+		chunk_size=MiB,
+		part_size=8 * MiB,
+		n_parallel=4,
+		max_retries=5,
+		backoff=0.5,
+		timeout=(10, 60),
+		session=None,
+	):
+		self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+		self.chunk_size = chunk_size
+		self.part_size = part_size
+		self.n_parallel = n_parallel
+		self.max_retries = max_retries
+		self.backoff = backoff
+		self.timeout = timeout
+
+		# One pooled session for every file this downloader fetches.
+		self.session = session or requests.Session()
+		adapter = HTTPAdapter(pool_connections=n_parallel, pool_maxsize=n_parallel)
+		self.session.mount("http://", adapter)
+		self.session.mount("https://", adapter)
+
+	def close(self):
+		self.session.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	# --- HTTP helpers ---
+	# ChunkedEncodingError is what requests raises when the connection drops mid-body.
+	RETRY_EXCEPTIONS = (
+		requests.ConnectionError,
+		requests.Timeout,
+		requests.HTTPError,
+		requests.exceptions.ChunkedEncodingError,
+	)
+
+	def _with_retries(self, fn):
+		for attempt in range(self.max_retries + 1):
+			try:
+				return fn()
+			except self.RETRY_EXCEPTIONS as e:
+				status = getattr(getattr(e, "response", None), "status_code", None)
+				if attempt == self.max_retries or (status is not None and status < 500 and status != 429):
+					raise
+				time.sleep(self.backoff * 2**attempt)
+
+	def _probe(self, url):
+		# Returns (size, accepts_ranges) from a one-byte range request.
+		def probe():
+			headers = dict(self.headers, Range="bytes=0-0")
+			with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+				response.raise_for_status()
+				if response.status_code == 206:
+					content_range = response.headers.get("Content-Range", "")
+					total = content_range.rpartition("/")[2]
+					return (int(total) if total.isdigit() else None), True
+				length = response.headers.get("Content-Length")
+				return (int(length) if length is not None else None), False
+		return self._with_retries(probe)
+
+	def _fetch_range(self, url, fp_path, start, end):
+		# Writes bytes [start, end] of url at the same offsets in fp_path.
+		def fetch():
+			headers = dict(self.headers, Range=f"bytes={start}-{end}")
+			with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+				response.raise_for_status()
+				if response.status_code != 206:
+					raise requests.HTTPError(f"Server ignored range request for {url}.", response=response)
+				received = 0
+				with open(fp_path, "r+b") as fp:
+					fp.seek(start)
+					for chunk in response.iter_content(chunk_size=self.chunk_size):
+						received += fp.write(chunk)
+			if received != end - start + 1:
+				raise requests.exceptions.ChunkedEncodingError(
+					f"Connection closed after {received} of {end - start + 1} bytes of {url} range {start}-{end}."
+				)
+		self._with_retries(fetch)
+
+	def _stream(self, url, part_path, size=None):
+		# Single-connection download; resumes from the partial file when the server allows.
+		# size is the probed length (None if unknown); a short body is retried from where it stopped.
+		def stream():
+			offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+			if size is not None and offset > size:
+				offset = 0
+			headers = dict(self.headers)
+			if offset:
+				headers["Range"] = f"bytes={offset}-"
+			with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+				if offset and response.status_code == 416:
+					# Nothing left to fetch only if the partial file is exactly the full size.
+					if offset == size:
+						return
+					os.remove(part_path)
+					return stream()
+				response.raise_for_status()
+				mode = "ab" if offset and response.status_code == 206 else "wb"
+				with open(part_path, mode) as fp:
+					for chunk in response.iter_content(chunk_size=self.chunk_size):
+						fp.write(chunk)
+			received = os.path.getsize(part_path)
+			if size is not None and received != size:
+				raise requests.exceptions.ChunkedEncodingError(
+					f"Connection closed after {received} of {size} bytes of {url}."
+				)
+		self._with_retries(stream)
+
+	def _parallel(self, url, part_path, size):
+		state_path = f"{part_path}.json"
+		parts = [(start, min(start + self.part_size, size) - 1) for start in range(0, size, self.part_size)]
+
+		done = set()
+		if os.path.exists(part_path) and os.path.exists(state_path):
+			with open(state_path, "r") as fp:
+				state = json.load(fp)
+			if state.get("size") == size and state.get("part_size") == self.part_size:
+				done = set(state["done"])
+		if not done:
+			with open(part_path, "wb") as fp:
+				fp.truncate(size)
+
+		lock = threading.Lock()
+		def fetch_part(index):
+			start, end = parts[index]
+			self._fetch_range(url, part_path, start, end)
+			with lock:
+				done.add(index)
+				with open(state_path, "w") as fp:
+					json.dump({"size": size, "part_size": self.part_size, "done": sorted(done)}, fp)
+
+		pending = [index for index in range(len(parts)) if index not in done]
+		with ThreadPoolExecutor(max_workers=self.n_parallel) as executor:
+			list(executor.map(fetch_part, pending))
+		os.remove(state_path)
+
+	# --- Public API ---
+	def download(self, url, path, sha256=None, manifest=None, force=False):
+		filename = os.path.basename(path)
+		entry = manifest.get(filename) if manifest is not None else None
+		expected = sha256 or (entry or {}).get("sha256")
+
+		size = accepts_ranges = None
+		if not force and os.path.exists(path):
+			if entry is not None and manifest.is_valid(path) and (sha256 is None or sha256 == expected):
+				return path
+			if entry is None:
+				if expected is not None:
+					actual = file_sha256(path)
+					if actual == expected:
+						self._record(manifest, filename, url, actual, path)
+						return path
+				else:
+					# Files fetched before the manifest existed are adopted when complete.
+					size, accepts_ranges = self._probe(url)
+					if size is not None and size == os.path.getsize(path):
+						self._record(manifest, filename, url, file_sha256(path), path)
+						return path
+
+		os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+		part_path = f"{path}.part"
+		if force:
+			for stale in (part_path, f"{part_path}.json"):
+				if os.path.exists(stale):
+					os.remove(stale)
+
+		if size is None:
+			size, accepts_ranges = self._probe(url)
+		if accepts_ranges and size is not None and size > self.part_size and self.n_parallel > 1:
+			self._parallel(url, part_path, size)
+		else:
+			# A parallel run leaves a full-size, sparsely filled .part that cannot be resumed
+			# sequentially.
+			state_path = f"{part_path}.json"
+			if os.path.exists(state_path):
+				for stale in (part_path, state_path):
+					if os.path.exists(stale):
+						os.remove(stale)
+			self._stream(url, part_path, size)
+
+		actual = file_sha256(part_path)
+		if expected is not None and actual != expected:
+			os.remove(part_path)
+			raise ValueError(f"Checksum mismatch for {url}: expected {expected}, got {actual}.")
+		os.replace(part_path, path)
+		self._record(manifest, filename, url, actual, path)
+		return path
+
+	@staticmethod
+	def _record(manifest, filename, url, sha256, path):
+		if manifest is not None:
+			manifest.record(filename, url, sha256, os.path.getsize(path))
+
+	def download_many(self, items, manifest=None, force=False):
+		# items: iterable of (url, path) or (url, path, sha256); files are fetched in turn
+		# over the same pooled connections, each one split into parallel ranges.
+		paths = list()
+		for item in items:
+			url, path, *rest = item
+			paths.append(self.download(url, path, sha256=rest[0] if rest else None, manifest=manifest, force=force))
+		return paths
@@ -0,0 +1,180 @@
+import sys
+
+import numpy as np
+
+# Batched metrics over (n_series, horizon) arrays. Every function takes an optional boolean
+# mask (True = observed) for ragged horizons and returns one score per series. Inputs may be
+# numpy arrays or torch tensors; tensors are computed with torch ops on their own device.
+
+def _xp(x):
+	torch = sys.modules.get("torch")
+	if torch is not None and isinstance(x, torch.Tensor):
+		return torch
+	return np
+
+def _bool_mask(mask, like):
+	if mask is None:
+		return None
+	if _xp(like) is np:
+		return np.asarray(mask, dtype=bool)
+	return mask.to(device=like.device, dtype=bool)
+
+def _divide(num, den):
+	# num / den with NaN where den == 0 (e.g. series with no observed points).
+	xp = _xp(num)
+	valid = den > 0
+	return xp.where(valid, num / xp.where(valid, den, xp.ones_like(den)), float("nan"))
+
+def _masked_sum(values, mask):
+	xp = _xp(values)
+	if mask is None:
+		return values.sum(-1)
+	return xp.where(_bool_mask(mask, values), values, xp.zeros_like(values)).sum(-1)
+
+def _masked_mean(values, mask):
+	if mask is None:
+		return values.mean(-1)
+	return _divide(_masked_sum(values, mask), _bool_mask(mask, values).sum(-1) * 1.0)
+
+def _as_array(x):
+	return x if _xp(x) is not np else np.asarray(x, dtype=np.float64)
+
+def aggregate(scores):
+	# Mean over the series that have a score (NaN-safe).
+	xp = _xp(scores)
+	return xp.nanmean(scores)
+
+# --- Point metrics ---
+def mae(y_true, y_pred, mask=None):
+	y_true, y_pred = _as_array(y_true), _as_array(y_pred)
+	return _masked_mean(abs(y_pred - y_true), mask)
+
+def mse(y_true, y_pred, mask=None):
+	y_true, y_pred = _as_array(y_true), _as_array(y_pred)
+	return _masked_mean((y_pred - y_true) ** 2, mask)
+
+def rmse(y_true, y_pred, mask=None):
+	return _xp(y_true).sqrt(mse(y_true, y_pred, mask))
+
+def mape(y_true, y_pred, mask=None, eps=1e-8):
+	y_true, y_pred = _as_array(y_true), _as_array(y_pred)
+	y_true = y_true.clip(eps, None)
+	return 100 * _masked_mean(abs((y_true - y_pred) / y_true), mask)
+
+def smape(y_true, y_pred, mask=None, eps=1e-8):
+	y_true, y_pred = _as_array(y_true), _as_array(y_pred)
+	denominator = abs(y_true) + abs(y_pred) + eps
+	return 200 * _masked_mean(abs(y_pred - y_true) / denominator, mask)
+
+def r2_score(y_true, y_pred, mask=None, eps=1e-8):
+	y_true, y_pred = _as_array(y_true), _as_array(y_pred)
+	mean = _masked_mean(y_true, mask)[..., None]
+	ss_res = _masked_sum((y_true - y_pred) ** 2, mask)
+	ss_tot = _masked_sum((y_true - mean) ** 2, mask)
+	return 1 - ss_res / (ss_tot + eps)
+
+# --- Scaled metrics (M4 / Tourism) ---
+def mase_scale(insample, seasonality=1, insample_mask=None):
+	# In-sample mean absolute seasonal-naive error per series.
+	insample = _as_array(insample)
+	diffs = abs(insample[:, seasonality:] - insample[:, :-seasonality])
+	pair_mask = None
+	if insample_mask is not None:
+		insample_mask = _bool_mask(insample_mask, insample)
+		pair_mask = insample_mask[:, seasonality:] & insample_mask[:, :-seasonality]
+	return _masked_mean(diffs, pair_mask)
+
+def mase(y_true, y_pred, insample, seasonality=1, mask=None, insample_mask=None, scale=None):
+	# scale may be precomputed with mase_scale (it only depends on the training data).
+	if scale is None:
+		scale = mase_scale(insample, seasonality, insample_mask)
+	return _divide(mae(y_true, y_pred, mask), scale)
+
+def naive2_forecast(insample, horizon, seasonality=1, insample_mask=None):
+	# M4 Naive2 benchmark: seasonal naive on the multiplicatively deseasonalized series,
+	# applied only where a 90% autocorrelation test finds seasonality. Series are expected to
+	# be right-aligned (most recent value in the last column) with leading padding masked out.
+	insample = np.asarray(insample, dtype=np.float64)
+	n_series, length = insample.shape
+	mask = np.ones_like(insample, dtype=bool) if insample_mask is None else np.asarray(insample_mask, dtype=bool)
+	n_obs = mask.sum(1)
+	steps = np.arange(horizon)
+
+	last = insample[:, -1]
+	if seasonality <= 1 or length < 2 * seasonality:
+		# Too short to deseasonalize (M4 rule): non-seasonal Naive2, the last value repeated.
+		return np.repeat(last[:, None], horizon, axis=1)
+
+	# Seasonality test on the autocorrelation at lag `seasonality`.
+	values = np.where(mask, insample, 0.0)
+	centered = np.where(mask, insample - (values.sum(1) / np.maximum(n_obs, 1))[:, None], 0.0)
+	variance = (centered ** 2).sum(1)
+	acf = np.stack([
+		(centered[:, lag:] * centered[:, :-lag]).sum(1) for lag in range(1, seasonality + 1)
+	], axis=1) / np.where(variance > 0, variance, 1.0)[:, None]
+	limit = 1.645 * np.sqrt((1 + 2 * (acf[:, :-1] ** 2).sum(1)) / np.maximum(n_obs, 1))
+	seasonal = (n_obs >= 3 * seasonality) & (np.abs(acf[:, -1]) > limit)
+
+	# Classical multiplicative decomposition: centered (2 x m for even m) moving average.
+	if seasonality % 2 == 0:
+		weights = np.r_[0.5, np.ones(seasonality - 1), 0.5] / seasonality
+	else:
+		weights = np.ones(seasonality) / seasonality
+	padded = np.where(mask, insample, np.nan)
+	trend = np.full_like(padded, np.nan)
+	half = len(weights) // 2
+	trend[:, half:length - half] = np.lib.stride_tricks.sliding_window_view(padded, len(weights), axis=1) @ weights
+	with np.errstate(invalid="ignore", divide="ignore"):
+		ratio = padded / trend
+
+	# Season positions are counted from each series' first observation.
+	positions = (np.arange(length)[None, :] - (length - n_obs)[:, None]) % seasonality
+	indices = np.ones((n_series, seasonality))
+	for position in range(seasonality):
+		selected = (positions == position) & np.isfinite(ratio)
+		counts = selected.sum(1)
+		sums = np.where(selected, ratio, 0.0).sum(1)
+		indices[:, position] = np.where(counts > 0, sums / np.maximum(counts, 1), 1.0)
+	indices /= indices.mean(1, keepdims=True)
+	indices[~seasonal] = 1.0
+
+	rows = np.arange(n_series)[:, None]
+	last_index = indices[np.arange(n_series), (n_obs - 1) % seasonality]
+	forecast_index = indices[rows, (n_obs[:, None] + steps[None, :]) % seasonality]
+	return (last / last_index)[:, None] * forecast_index
+
+def owa(y_true, y_pred, insample, seasonality=1, mask=None, insample_mask=None, naive_pred=None):
+	# Overall Weighted Average relative to Naive2 (M4): mean of the dataset-level sMAPE and
+	# MASE ratios. naive_pred can be precomputed with naive2_forecast and reused across calls.
+	y_true, y_pred = _as_array(y_true), _as_array(y_pred)
+	if naive_pred is None:
+		naive_insample = insample if _xp(insample) is np else insample.cpu().numpy()
+		naive_mask = insample_mask if insample_mask is None or _xp(insample_mask) is np else insample_mask.cpu().numpy()
+		naive_pred = naive2_forecast(naive_insample, y_true.shape[1], seasonality, naive_mask)
+		if _xp(y_pred) is not np:
+			naive_pred = _xp(y_pred).as_tensor(naive_pred, dtype=y_pred.dtype, device=y_pred.device)
+
+	scale = mase_scale(insample, seasonality, insample_mask)
+	smape_ratio = aggregate(smape(y_true, y_pred, mask)) / aggregate(smape(y_true, naive_pred, mask))
+	mase_ratio = aggregate(mase(y_true, y_pred, insample, mask=mask, scale=scale)) / \
+		aggregate(mase(y_true, naive_pred, insample, mask=mask, scale=scale))
+	return 0.5 * (smape_ratio + mase_ratio)
+
+def evaluate_series(y_true, y_pred, mask=None, insample=None, seasonality=1, insample_mask=None, naive_pred=None):
+	# One pass over (n_series, horizon) forecasts. Returns {"per_series": {metric: (n_series,)},
+	# "aggregate": {metric: scalar}}; MASE and OWA are included when insample is given.
+	per_series = {
+		"MAE": mae(y_true, y_pred, mask),
+		"MSE": mse(y_true, y_pred, mask),
+		"RMSE": rmse(y_true, y_pred, mask),
+		"MAPE": mape(y_true, y_pred, mask),
+		"sMAPE": smape(y_true, y_pred, mask),
+		"R2": r2_score(y_true, y_pred, mask),
+	}
+	aggregates = dict()
+	if insample is not None:
+		per_series["MASE"] = mase(y_true, y_pred, insample, seasonality, mask, insample_mask)
+		aggregates["OWA"] = owa(y_true, y_pred, insample, seasonality, mask, insample_mask, naive_pred)
+
+	aggregates = {**{name: aggregate(scores) for name, scores in per_series.items()}, **aggregates}
+	return {"per_series": per_series, "aggregate": aggregates}
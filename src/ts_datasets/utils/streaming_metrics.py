@@ -0,0 +1,110 @@
+import numpy as np
+
+from .series_metrics import _xp
+
+class MetricAccumulator:
+	# Online version of metrics.evaluate_all_metrics: update() with batches as they stream out
+	# of the model, merge() partial accumulators from other workers, then read the scores.
+	# R2 tracks the mean/M2 of y_true with Welford/Chan updates, so no global mean is needed.
+	# Torch batches are reduced on their own device; results are read back only on demand.
+	STATE_KEYS = ("count", "sum_abs", "sum_sq", "sum_ape", "sum_sape", "mean_true", "m2_true")
+
+	def __init__(self, eps=1e-8):
+		self.eps = eps
+		for key in self.STATE_KEYS:
+			setattr(self, key, 0.0)
+
+	def update(self, y_true, y_pred):
+		xp = _xp(y_true)
+		if xp is np:
+			y_true = np.asarray(y_true, dtype=np.float64).ravel()
+			y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+		else:
+			y_true = y_true.detach().reshape(-1).double()
+			y_pred = y_pred.detach().reshape(-1).double()
+
+		count = y_true.shape[0]
+		if count == 0:
+			return self
+		error = y_pred - y_true
+		clipped = y_true.clip(self.eps, None)
+		self.sum_abs = self.sum_abs + abs(error).sum()
+		self.sum_sq = self.sum_sq + (error ** 2).sum()
+		self.sum_ape = self.sum_ape + abs((clipped - y_pred) / clipped).sum()
+		self.sum_sape = self.sum_sape + (abs(error) / (abs(y_true) + abs(y_pred) + self.eps)).sum()
+
+		batch_mean = y_true.mean()
+		batch_m2 = ((y_true - batch_mean) ** 2).sum()
+		self._combine(count, batch_mean, batch_m2)
+		return self
+
+	def _combine(self, count, mean, m2):
+		# Chan et al. parallel variance update.
+		total = self.count + count
+		delta = mean - self.mean_true
+		self.mean_true = self.mean_true + delta * (count / total)
+		self.m2_true = self.m2_true + m2 + delta ** 2 * (self.count * count / total)
+		self.count = total
+
+	def merge(self, other):
+		if other.count == 0:
+			return self
+		self.sum_abs = self.sum_abs + other.sum_abs
+		self.sum_sq = self.sum_sq + other.sum_sq
+		self.sum_ape = self.sum_ape + other.sum_ape
+		self.sum_sape = self.sum_sape + other.sum_sape
+		self._combine(other.count, other.mean_true, other.m2_true)
+		return self
+
+	@classmethod
+	def merged(cls, accumulators):
+		result = None
+		for accumulator in accumulators:
+			result = cls(accumulator.eps) if result is None else result
+			result.merge(accumulator)
+		return cls() if result is None else result
+
+	# --- Cross-process transport (plain floats, picklable/JSON-able) ---
+	def state_dict(self):
+		return {"eps": self.eps, **{key: float(getattr(self, key)) for key in self.STATE_KEYS}}
+
+	@classmethod
+	def from_state_dict(cls, state):
+		accumulator = cls(state["eps"])
+		for key in cls.STATE_KEYS:
+			setattr(accumulator, key, state[key])
+		return accumulator
+
+	# --- Scores ---
+	def _mean(self, total):
+		return float(total) / self.count if self.count else float("nan")
+
+	def mae(self):
+		return self._mean(self.sum_abs)
+
+	def mse(self):
+		return self._mean(self.sum_sq)
+
+	def rmse(self):
+		return float(np.sqrt(self.mse()))
+
+	def mape(self):
+		return 100 * self._mean(self.sum_ape)
+
+	def smape(self):
+		return 200 * self._mean(self.sum_sape)
+
+	def r2_score(self):
+		if not self.count:
+			return float("nan")
+		return 1 - float(self.sum_sq) / (float(self.m2_true) + self.eps)
+
+	def result(self):
+		return {
+			"MAE": self.mae(),
+			"MSE": self.mse(),
+			"RMSE": self.rmse(),
+			"MAPE": self.mape(),
+			"sMAPE": self.smape(),
+			"R2": self.r2_score()
+		}
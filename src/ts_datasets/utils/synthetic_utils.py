@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+
+import numpy as np
+
+LENGTH_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+MANIFEST_FILE = "manifest.json"
+SHARD_FORMAT_VERSION = 1
+
+def sample_lengths(random, n_series, length_dist="uniform", min_length=50, max_length=500):
+	if length_dist == "fixed":
+		return np.full(n_series, max_length, dtype=np.int64)
+	if length_dist == "uniform":
+		return random.integers(min_length, max_length + 1, size=n_series)
+	if length_dist == "lognormal":
+		# Heavy right tail like real collections: many short series, a few long ones.
+		median = np.sqrt(min_length * max_length)
+		sigma = np.log(max_length / median) / 2
+		lengths = np.exp(random.normal(np.log(median), sigma, size=n_series))
+		return np.clip(np.rint(lengths), min_length, max_length).astype(np.int64)
+	raise ValueError(f"length_dist must be one of {LENGTH_DISTRIBUTIONS}, got {length_dist!r}.")
+
+def generate_series(
+	n_series,
+	seed=None,
+	length_dist="uniform",
+	min_length=50,
+	max_length=500,
+	trend_prob=0.7,
+	seasonal_prob=0.7,
+	periods=(4, 7, 12, 24),
+	n_harmonics=2,
+	noise_scale=(0.05, 0.5),
+	level=(1.0, 10.0),
+	dtype=np.float32,
+):
+	# All series are built in one pass over a flat buffer (as in MultiSeriesWindowDataset.from_flat):
+	# per-series parameters are sampled as vectors and broadcast to the points via series ids.
+	# Returns (values, offsets) with series ii at values[offsets[ii]:offsets[ii + 1]].
+	random = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+	lengths = sample_lengths(random, n_series, length_dist, min_length, max_length)
+	offsets = np.zeros(n_series + 1, dtype=np.int64)
+	np.cumsum(lengths, out=offsets[1:])
+	series_ids = np.repeat(np.arange(n_series), lengths)
+	tt = (np.arange(offsets[-1]) - offsets[series_ids]).astype(np.float64)
+
+	# Level and a (possibly curved) trend, scaled relative to the level.
+	levels = random.uniform(*level, size=n_series)
+	has_trend = random.random(n_series) < trend_prob
+	slopes = np.where(has_trend, random.normal(0, 0.01, n_series), 0.0) * levels
+	curvature = np.where(has_trend, random.normal(0, 1e-5, n_series), 0.0) * levels
+	values = levels[series_ids] + slopes[series_ids] * tt + curvature[series_ids] * tt**2
+
+	# Seasonality: a random period per series with decaying harmonics.
+	has_seasonal = random.random(n_series) < seasonal_prob
+	series_periods = random.choice(np.asarray(periods), size=n_series)
+	angle = 2 * np.pi * tt / series_periods[series_ids]
+	for hh in range(1, n_harmonics + 1):
+		amplitudes = np.where(has_seasonal, random.uniform(0.05, 0.3, n_series), 0.0) * levels / hh
+		phases = random.uniform(0, 2 * np.pi, n_series)
+		values += amplitudes[series_ids] * np.sin(hh * angle + phases[series_ids])
+
+	# Noise with a per-series, log-uniform scale relative to the level.
+	scales = np.exp(random.uniform(np.log(noise_scale[0]), np.log(noise_scale[1]), n_series)) * levels / 10
+	values += random.standard_normal(len(values)) * scales[series_ids]
+
+	return values.astype(dtype, copy=False), offsets
+
+def _shard_paths(output_dir, shard_idx):
+	prefix = os.path.join(output_dir, f"shard_{shard_idx:05d}")
+	return f"{prefix}.values.npy", f"{prefix}.offsets.npy"
+
+def _save_npy(path, array):
+	tmp_path = f"{path}.tmp"
+	with open(tmp_path, "wb") as fp:
+		np.save(fp, array)
+	os.replace(tmp_path, path)
+
+def write_shards(output_dir, n_series, shard_size=20_000, seed=42, n_workers=4, **generator_kwargs):
+	# Each shard gets its own child seed (SeedSequence.spawn), so any shard can be regenerated
+	# on its own and results do not depend on n_workers. Shards are written as they finish
+	# (uncompressed .npy, memory-mappable); memory stays bounded by n_workers shards.
+	os.makedirs(output_dir, exist_ok=True)
+	n_shards = max(1, -(-n_series // shard_size))
+	seeds = np.random.SeedSequence(seed).spawn(n_shards)
+
+	def write(shard_idx):
+		n_shard_series = min(shard_size, n_series - shard_idx * shard_size)
+		values, offsets = generate_series(
+			n_shard_series, seed=np.random.default_rng(seeds[shard_idx]), **generator_kwargs
+		)
+		values_path, offsets_path = _shard_paths(output_dir, shard_idx)
+		_save_npy(values_path, values)
+		_save_npy(offsets_path, offsets)
+		return {"n_series": n_shard_series, "n_values": int(offsets[-1])}
+
+	with ThreadPoolExecutor(max_workers=n_workers) as executor:
+		shards = list(executor.map(write, range(n_shards)))
+
+	manifest = {
+		"version": SHARD_FORMAT_VERSION,
+		"seed": seed,
+		"n_series": n_series,
+		"shard_size": shard_size,
+		"generator": {
+			key: (list(value) if isinstance(value, tuple) else value)
+			for key, value in generator_kwargs.items() if key != "dtype"
+		},
+		"shards": shards,
+	}
+	with open(os.path.join(output_dir, MANIFEST_FILE), "w") as fp:
+		json.dump(manifest, fp, indent=2)
+	return manifest
+
+def load_manifest(output_dir):
+	with open(os.path.join(output_dir, MANIFEST_FILE), "r") as fp:
+		manifest = json.load(fp)
+	if manifest.get("version") != SHARD_FORMAT_VERSION:
+		raise ValueError(f"Unsupported shard format version {manifest.get('version')!r} in {output_dir}.")
+	return manifest
+
+def read_shard(output_dir, shard_idx, mmap=True):
+	values_path, offsets_path = _shard_paths(output_dir, shard_idx)
+	mmap_mode = "r" if mmap else None
+	return np.load(values_path, mmap_mode=mmap_mode), np.load(offsets_path)
+
+def iter_shards(output_dir, mmap=True):
+	for shard_idx in range(len(load_manifest(output_dir)["shards"])):
+		yield read_shard(output_dir, shard_idx, mmap=mmap)
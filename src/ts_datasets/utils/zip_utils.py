@@ -1,27 +1,97 @@
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
-import time
+import shutil
+import threading
 import zipfile
 
-def extract_zip(zip_filename, extract_to, force=False):
+MANIFEST_FILE = ".extract_manifest.json"
+
+def _load_manifest(path):
+	if not os.path.exists(path):
+		return {}
+	with open(path, "r") as fp:
+		return json.load(fp)
+
+def _save_manifest(path, manifest):
+	tmp_path = f"{path}.{os.getpid()}.tmp"
+	with open(tmp_path, "w") as fp:
+		json.dump(manifest, fp, indent=2)
+	os.replace(tmp_path, path)
+
+def _archive_signature(zip_filename):
+	stat = os.stat(zip_filename)
+	return [stat.st_size, stat.st_mtime_ns]
+
+def extract_zip(zip_filename, extract_to, force=False, n_workers=4, chunk_size=1024 * 1024, verbose=False):
+	# Members are streamed to disk in chunk_size pieces (bounded memory) by n_workers threads,
+	# each with its own ZipFile handle so decompression runs in parallel. A CRC/size manifest in
+	# extract_to lets a repeat run over an unchanged archive skip with a single stat.
+	extract_to = os.path.abspath(extract_to)
+	os.makedirs(extract_to, exist_ok=True)
+	manifest_path = os.path.join(extract_to, MANIFEST_FILE)
+	manifest = _load_manifest(manifest_path)
+	archive_key = os.path.basename(zip_filename)
+	signature = _archive_signature(zip_filename)
+
+	recorded = manifest.get(archive_key)
+	if not force and recorded is not None and recorded["archive"] == signature:
+		print(f"Skipped (up-to-date): {len(recorded['members'])} files from {archive_key}")
+		return []
+
+	recorded_members = {} if force or recorded is None else recorded["members"]
+	members = dict()
+	pending = list()
 	with zipfile.ZipFile(zip_filename, "r") as zip_fp:
 		for item in zip_fp.infolist():
 			extracted_path = os.path.normpath(os.path.join(extract_to, item.filename))
 
 			# Path traversal protection
-			if not extracted_path.startswith(os.path.abspath(extract_to)):
+			if os.path.commonpath([extracted_path, extract_to]) != extract_to:
 				raise Exception(f"Unsafe path in zip file: {item.filename}")
 
-			should_extract = force or (
-				not os.path.exists(extracted_path) or
-				datetime(*item.date_time) > datetime.fromtimestamp(os.path.getmtime(extracted_path))
+			if item.is_dir():
+				os.makedirs(extracted_path, exist_ok=True)
+				continue
+
+			members[item.filename] = [item.CRC, item.file_size]
+			up_to_date = (
+				recorded_members.get(item.filename) == members[item.filename] and
+				os.path.exists(extracted_path)
 			)
+			if not up_to_date:
+				pending.append((item, extracted_path))
+
+	local = threading.local()
+	handles = list()
+	handles_lock = threading.Lock()
+
+	def extract(job):
+		item, extracted_path = job
+		if not hasattr(local, "zip_fp"):
+			local.zip_fp = zipfile.ZipFile(zip_filename, "r")
+			with handles_lock:
+				handles.append(local.zip_fp)
+		os.makedirs(os.path.dirname(extracted_path), exist_ok=True)
+		tmp_path = f"{extracted_path}.part"
+		with local.zip_fp.open(item) as src_fp, open(tmp_path, "wb") as out_fp:
+			shutil.copyfileobj(src_fp, out_fp, chunk_size)
+		os.replace(tmp_path, extracted_path)
+		if verbose:
+			print(f"Extracted: {item.filename}")
+		return item.filename
 
-			if should_extract:
-				os.makedirs(os.path.dirname(extracted_path), exist_ok=True)
-				with open(extracted_path, "wb") as out_fp:
-					out_fp.write(zip_fp.read(item))
-				print(f"Extracted: {item.filename}")
-			else:
-				print(f"Skipped (up-to-date): {item.filename}")
+	try:
+		if n_workers > 1 and len(pending) > 1:
+			with ThreadPoolExecutor(max_workers=n_workers) as executor:
+				extracted = list(executor.map(extract, pending))
+		else:
+			extracted = [extract(job) for job in pending]
+	finally:
+		for handle in handles:
+			handle.close()
 
+	manifest[archive_key] = {"archive": signature, "members": members}
+	_save_manifest(manifest_path, manifest)
+	print(f"Extracted {len(extracted)} files, skipped {len(members) - len(extracted)} (up-to-date) from {archive_key}")
+	return extracted
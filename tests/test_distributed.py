@@ -0,0 +1,16 @@
+import torch
+import torch.distributed as dist
+
+from nbeats.training import launch
+
+
+def _large_result(rank, world_size):
+	# Larger than the pipe buffer, so rank 0's put() blocks until the parent reads it.
+	dist.barrier()
+	return torch.full((200_000,), float(world_size))
+
+
+def test_launch_returns_large_result():
+	result = launch(_large_result, 2, threads_per_rank=1)
+	assert result.shape == (200_000,)
+	assert torch.all(result == 2)
@@ -0,0 +1,101 @@
+import hashlib
+import http.server
+import json
+import os
+import re
+import threading
+
+import pytest
+
+from ts_datasets.utils.download_utils import Downloader, DownloadManifest
+
+DATA = os.urandom(3 * 1024 * 1024 + 17)
+SHA256 = hashlib.sha256(DATA).hexdigest()
+
+
+class RangeHandler(http.server.BaseHTTPRequestHandler):
+	# Serves DATA with Range support; the first `drops` responses are cut off mid-body.
+	protocol_version = "HTTP/1.1"
+	drops = 0
+
+	def log_message(self, *args):
+		pass
+
+	def do_GET(self):
+		start, end = 0, len(DATA) - 1
+		match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+		if match:
+			start = int(match.group(1))
+			end = int(match.group(2)) if match.group(2) else end
+			if start >= len(DATA):
+				self.send_response(416)
+				self.send_header("Content-Length", "0")
+				self.end_headers()
+				return
+			self.send_response(206)
+			self.send_header("Content-Range", f"bytes {start}-{end}/{len(DATA)}")
+		else:
+			self.send_response(200)
+		body = DATA[start : end + 1]
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		if len(body) > 1 and type(self).drops > 0:
+			type(self).drops -= 1
+			self.wfile.write(body[: len(body) // 2])
+			self.wfile.flush()
+			self.close_connection = True
+			return
+		self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+	RangeHandler.drops = 0
+	httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+	thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+	thread.start()
+	yield f"http://127.0.0.1:{httpd.server_port}/data.zip"
+	httpd.shutdown()
+	httpd.server_close()
+
+
+@pytest.mark.parametrize("n_parallel", [1, 4])
+def test_retries_connection_dropped_mid_body(server, tmp_path, n_parallel):
+	RangeHandler.drops = 2
+	path = tmp_path / "data.zip"
+	manifest = DownloadManifest(str(tmp_path / "downloads.json"))
+	with Downloader(part_size=1024 * 1024, n_parallel=n_parallel, backoff=0.01) as downloader:
+		downloader.download(server, str(path), manifest=manifest)
+
+	assert RangeHandler.drops == 0
+	assert path.read_bytes() == DATA
+	assert manifest.get("data.zip")["sha256"] == SHA256
+	assert not os.path.exists(f"{path}.part")
+
+
+def test_sequential_download_discards_parallel_partial(server, tmp_path):
+	# An interrupted parallel run leaves a full-size, zero-filled .part and its state file.
+	path = tmp_path / "data.zip"
+	part_path = f"{path}.part"
+	with open(part_path, "wb") as fp:
+		fp.truncate(len(DATA))
+	with open(f"{part_path}.json", "w") as fp:
+		json.dump({"size": len(DATA), "part_size": 1024 * 1024, "done": []}, fp)
+
+	manifest = DownloadManifest(str(tmp_path / "downloads.json"))
+	with Downloader(n_parallel=1, backoff=0.01) as downloader:
+		downloader.download(server, str(path), manifest=manifest)
+
+	assert path.read_bytes() == DATA
+	assert manifest.get("data.zip")["sha256"] == SHA256
+	assert not os.path.exists(f"{part_path}.json")
+
+
+def test_oversized_partial_is_restarted(server, tmp_path):
+	path = tmp_path / "data.zip"
+	with open(f"{path}.part", "wb") as fp:
+		fp.write(b"\0" * (len(DATA) + 10))
+
+	with Downloader(n_parallel=1, backoff=0.01) as downloader:
+		downloader.download(server, str(path), sha256=SHA256)
+	assert path.read_bytes() == DATA
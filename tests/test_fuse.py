@@ -0,0 +1,36 @@
+import warnings
+
+import pytest
+import torch
+
+from nbeats.blocks import FusedBlock
+from nbeats.models import NBeatsGeneric, NBeatsInterpretable
+
+
+@pytest.mark.parametrize("factory", [
+	lambda: NBeatsGeneric(backcast=12, forecast=4, n_stacks=3, n_blocks=2),
+	lambda: NBeatsGeneric(backcast=12, forecast=4, n_stacks=2, n_blocks=3, shared_weights=True),
+	lambda: NBeatsInterpretable(backcast=12, forecast=4, n_blocks=2, degree=2, n_harmonics=2),
+])
+def test_fuse_for_inference_fuses_every_block(factory):
+	torch.manual_seed(0)
+	model = factory().eval()
+	fused = model.fuse_for_inference()
+
+	assert all(isinstance(block, FusedBlock) for stack in fused.stacks for block in stack.blocks)
+	X = torch.randn(16, 12)
+	with torch.no_grad():
+		torch.testing.assert_close(fused(X), model(X), rtol=1e-5, atol=1e-5)
+
+
+def test_fusing_a_fused_model_warns():
+	fused = NBeatsGeneric(backcast=12, forecast=4, n_stacks=1, n_blocks=2).fuse_for_inference()
+	with pytest.warns(UserWarning, match="already fused"):
+		refused = fused.fuse_for_inference()
+	X = torch.randn(4, 12)
+	with torch.no_grad():
+		torch.testing.assert_close(refused(X), fused(X))
+
+	with warnings.catch_warnings():
+		warnings.simplefilter("error")
+		NBeatsGeneric(backcast=12, forecast=4, n_stacks=1, n_blocks=2).fuse_for_inference()
@@ -0,0 +1,22 @@
+import numpy as np
+import torch
+
+from nbeats.models import NBeatsGeneric
+
+
+def test_to_numpy_arrays_survive_later_batches():
+	torch.manual_seed(0)
+	model = NBeatsGeneric(backcast=12, forecast=4, n_stacks=2, n_blocks=2).eval()
+	capture = model.build_capture()
+
+	with torch.inference_mode():
+		model(torch.randn(8, 12), capture=capture)
+		first = capture.to_numpy()
+		expected = {kind: array.copy() for kind, array in first.items()}
+		model(torch.randn(8, 12), capture=capture)
+		second = capture.to_numpy()
+
+	for kind in capture.keep:
+		assert not np.shares_memory(first[kind], getattr(capture, kind).numpy())
+		np.testing.assert_array_equal(first[kind], expected[kind])
+		assert not np.array_equal(first[kind], second[kind])
@@ -0,0 +1,24 @@
+import numpy as np
+
+from ts_datasets.utils import series_metrics
+
+
+def test_naive2_short_history_falls_back_to_naive():
+	# 12 observations are fewer than 2 * seasonality for monthly data.
+	insample = np.arange(1.0, 25.0).reshape(2, 12)
+	forecast = series_metrics.naive2_forecast(insample, horizon=6, seasonality=12)
+	np.testing.assert_array_equal(forecast, np.repeat(insample[:, -1:], 6, axis=1))
+
+
+def test_naive2_short_series_in_padded_batch():
+	# A short right-aligned series next to a long seasonal one is never deseasonalized.
+	random = np.random.default_rng(0)
+	tt = np.arange(48)
+	long_series = 10 + 3 * np.sin(2 * np.pi * tt / 4) + random.normal(0, 0.1, 48)
+	insample = np.stack([long_series, np.r_[np.zeros(43), [5.0, 6.0, 7.0, 8.0, 9.0]]])
+	mask = np.ones_like(insample, dtype=bool)
+	mask[1, :43] = False
+
+	forecast = series_metrics.naive2_forecast(insample, horizon=4, seasonality=4, insample_mask=mask)
+	np.testing.assert_array_equal(forecast[1], np.full(4, 9.0))
+	assert not np.allclose(forecast[0], forecast[0, 0])